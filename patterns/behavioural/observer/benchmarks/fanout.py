@@ -0,0 +1,254 @@
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from ..solution_01.customer import Subscriber as AbstractSubscriber
+from ..solution_01.product import Product
+from ..solution_01.store import Store as AbstractStore
+from ..solution_02.store import Store as ProtocolStore
+from ..solution_03.store import Store as FunctionStore
+from ..solution_04.store import Store as CallableStore
+
+
+class Solution(NamedTuple):
+    name: str
+    make_store: Callable[[], Any]
+    make_subscriber: Callable[[], Any]
+    notify: Callable[[Any, Product], None]
+
+
+class CountingSubscriber(AbstractSubscriber):
+    __slots__ = ("received",)
+
+    def __init__(self) -> None:
+        self.received = 0
+
+    def notify(self, product: Product) -> None:
+        self.received += 1
+
+
+class CountingCallable:
+    __slots__ = ("received",)
+
+    def __init__(self) -> None:
+        self.received = 0
+
+    def __call__(self, product: Product) -> None:
+        self.received += 1
+
+
+def counting_function() -> Callable[[Product], None]:
+    received = 0
+
+    def notify(product: Product) -> None:
+        nonlocal received
+        received += 1
+
+    return notify
+
+
+SOLUTIONS = [
+    Solution(
+        "solution_01",
+        lambda: AbstractStore(name="bench"),
+        CountingSubscriber,
+        lambda store, product: store.notify_subscribers(product),
+    ),
+    Solution(
+        "solution_02",
+        lambda: ProtocolStore(name="bench"),
+        CountingSubscriber,
+        lambda store, product: store.notify_subscribers(product),
+    ),
+    Solution(
+        "solution_03",
+        lambda: FunctionStore(name="bench"),
+        counting_function,
+        lambda store, product: store.notify(product),
+    ),
+    Solution(
+        "solution_04",
+        lambda: CallableStore(name="bench"),
+        CountingCallable,
+        lambda store, product: store.notify(product),
+    ),
+]
+
+
+@dataclass
+class Timing:
+    operations: int
+    total_seconds: float
+    ops_per_second: float
+    p50_us: float
+    p99_us: float
+    p999_us: float
+    max_us: float
+
+
+@dataclass
+class Result:
+    solution: str
+    subscribers: int
+    products: int
+    interests_per_subscriber: int
+    timings: Dict[str, Timing] = field(default_factory=dict)
+    bytes_per_subscription: Optional[float] = None
+
+
+def percentile(ordered: Sequence[int], fraction: float) -> float:
+    index = min(len(ordered) - 1, int(fraction * len(ordered)))
+    return ordered[index] / 1_000
+
+
+def summarise(samples: List[int]) -> Timing:
+    ordered = sorted(samples)
+    total_seconds = sum(ordered) / 1e9
+    return Timing(
+        operations=len(ordered),
+        total_seconds=total_seconds,
+        ops_per_second=len(ordered) / total_seconds if total_seconds else 0.0,
+        p50_us=percentile(ordered, 0.5),
+        p99_us=percentile(ordered, 0.99),
+        p999_us=percentile(ordered, 0.999),
+        max_us=ordered[-1] / 1_000,
+    )
+
+
+def interests_of(
+    subscriber: int, catalog: Sequence[Product], interests: int
+) -> List[Product]:
+    return [
+        catalog[(subscriber * interests + offset) % len(catalog)]
+        for offset in range(interests)
+    ]
+
+
+def timed(samples: List[int], action: Callable[..., Any], *args: Any) -> None:
+    start = time.perf_counter_ns()
+    action(*args)
+    samples.append(time.perf_counter_ns() - start)
+
+
+def measure_memory(
+    solution: Solution, catalog: Sequence[Product], subscribers: int, interests: int
+) -> float:
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    store = solution.make_store()
+    for subscriber in range(subscribers):
+        store.subscribe(
+            solution.make_subscriber(), interests_of(subscriber, catalog, interests)
+        )
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (used - baseline) / (subscribers * interests)
+
+
+def run_one(
+    solution: Solution,
+    subscribers: int,
+    products: int,
+    interests: int,
+    lookups: int,
+    memory: bool,
+) -> Result:
+    catalog = [Product(f"Item{index}", "Brand", index) for index in range(products)]
+    result = Result(solution.name, subscribers, products, interests)
+
+    store = solution.make_store()
+    members = [solution.make_subscriber() for _ in range(subscribers)]
+
+    samples: List[int] = []
+    for index, member in enumerate(members):
+        timed(samples, store.subscribe, member, interests_of(index, catalog, interests))
+    result.timings["subscribe"] = summarise(samples)
+
+    samples = []
+    step = max(1, subscribers // max(1, lookups))
+    for member in members[::step][:lookups]:
+        timed(samples, store.is_subscribed, member)
+    result.timings["is_subscribed"] = summarise(samples)
+
+    samples = []
+    for product in catalog:
+        timed(samples, store.add_product, product)
+    result.timings["add_product"] = summarise(samples)
+
+    samples = []
+    for product in catalog:
+        timed(samples, solution.notify, store, product)
+    result.timings["notify"] = summarise(samples)
+
+    if memory:
+        del store, members
+        result.bytes_per_subscription = measure_memory(
+            solution, catalog, subscribers, interests
+        )
+
+    return result
+
+
+def run(
+    subscribers: Sequence[int],
+    products: int,
+    interests: int,
+    lookups: int,
+    solutions: Sequence[str],
+    memory: bool = True,
+) -> Dict[str, Any]:
+    results = [
+        run_one(solution, size, products, interests, lookups, memory)
+        for solution in SOLUTIONS
+        if solution.name in solutions
+        for size in subscribers
+    ]
+    return {
+        "benchmark": "observer-fanout",
+        "version": 1,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Observer fan-out benchmark")
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--interests", type=int, default=1)
+    parser.add_argument("--lookups", type=int, default=10)
+    parser.add_argument(
+        "--solutions", nargs="+", default=[solution.name for solution in SOLUTIONS]
+    )
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--output", help="JSON file, defaults to stdout")
+    args = parser.parse_args(argv)
+
+    report = run(
+        args.subscribers,
+        args.products,
+        args.interests,
+        args.lookups,
+        args.solutions,
+        memory=not args.no_memory,
+    )
+    text = json.dumps(report, indent=2, sort_keys=True)
+
+    if args.output is None:
+        print(text)
+        return
+
+    with open(args.output, "w", encoding="utf-8") as output:
+        output.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
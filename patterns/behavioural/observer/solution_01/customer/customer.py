@@ -6,22 +6,32 @@ from ..product import Product
 
 
 class Subscriber(ABC):
+    __slots__ = ()
+
     def notify(self, product: Product):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class Customer(Subscriber):
     name: str
     interests: List[Product]
     satisfied: bool = False
     own_products: Set[Product] = field(default_factory=set)
+    _wanted: Set[Product] = field(init=False, repr=False)
+    _remaining: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._wanted = set(self.interests)
+        self._remaining = len(self._wanted - self.own_products)
 
     def notify(self, product: Product) -> None:
-        if product not in self.interests:
+        if product not in self._wanted:
             print(f"I'm {self.name} and I am not interested in {product.name}")
             return
 
         print(f"I'm {self.name} and I bought a {product.name}")
-        self.own_products.add(product)
-        self.satisfied = all(product in self.own_products for product in self.interests)
+        if product not in self.own_products:
+            self.own_products.add(product)
+            self._remaining -= 1
+        self.satisfied = self._remaining == 0
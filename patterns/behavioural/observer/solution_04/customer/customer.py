@@ -1,21 +1,33 @@
 from dataclasses import dataclass, field
-from typing import List, Set
+from typing import Iterable, List, Set
 
 from ..product import Product
 
 
-@dataclass
+@dataclass(slots=True)
 class Customer:
     name: str
     interests: List[Product]
     satisfied: bool = False
     own_products: Set[Product] = field(default_factory=set)
+    _wanted: Set[Product] = field(init=False, repr=False)
+    _remaining: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._wanted = set(self.interests)
+        self._remaining = len(self._wanted - self.own_products)
 
     def __call__(self, product: Product) -> None:
-        if product not in self.interests:
+        if product not in self._wanted:
             print(f"I'm {self.name} and I am not interested in {product.name}")
             return
 
         print(f"I'm {self.name} and I bought a {product.name}")
-        self.own_products.add(product)
-        self.satisfied = all(product in self.own_products for product in self.interests)
+        if product not in self.own_products:
+            self.own_products.add(product)
+            self._remaining -= 1
+        self.satisfied = self._remaining == 0
+
+    def notify_many(self, products: Iterable[Product]) -> None:
+        for product in products:
+            self(product)
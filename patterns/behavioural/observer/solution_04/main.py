@@ -1,13 +1,16 @@
-import time
+from typing import Optional
+
 from .customer import Customer
-from .product import Product
+from .product import ProductCatalog
+from .scheduler import Clock, RealClock, Scheduler
 from .store import Store
 
 
-def main() -> None:
-    cellphone = Product("MobileX", "TechS", 300)
-    couch = Product("GiantSofa", "AllComfort", 800)
-    mug = Product("CoffeeM", "IndustrialTea", 20)
+def main(clock: Optional[Clock] = None) -> None:
+    catalog = ProductCatalog()
+    cellphone = catalog.get("MobileX", "TechS", 300)
+    couch = catalog.get("GiantSofa", "AllComfort", 800)
+    mug = catalog.get("CoffeeM", "IndustrialTea", 20)
 
     customers = [
         Customer(name="John", interests=[cellphone]),
@@ -15,7 +18,7 @@ def main() -> None:
         Customer(name="Alicia", interests=[cellphone, mug]),
     ]
 
-    store = Store(name="AllYouNeed")
+    store = Store(name="AllYouNeed", catalog=catalog)
 
     for customer in customers:
         store.subscribe(customer, customer.interests)
@@ -25,27 +28,19 @@ def main() -> None:
 
     customers.append(late_customer)
 
-    initial_time = time.time()
+    scheduler = Scheduler(clock=clock or RealClock())
 
     products = [cellphone, couch, mug]
     estimated_time_arrivals = [1, 2, 4]
 
-    while True:
-        current_time = time.time() - initial_time
-
-        for product, eta in zip(products, estimated_time_arrivals):
-            if current_time >= eta and product not in store.products:
-                store.add_product(product)
-
-        if current_time >= late_customer_arrival and not store.is_subscribed(
-            late_customer
-        ):
-            store.subscribe(late_customer, late_customer.interests)
+    for product, eta in zip(products, estimated_time_arrivals):
+        scheduler.schedule_at(eta, store.add_product, product)
 
-        if all(customer.satisfied for customer in customers):
-            break
+    scheduler.schedule_at(
+        late_customer_arrival, store.subscribe, late_customer, late_customer.interests
+    )
 
-        time.sleep(0.05)  # To avoid blocking CPU
+    scheduler.run(until=lambda: all(customer.satisfied for customer in customers))
 
 
 if __name__ == "__main__":
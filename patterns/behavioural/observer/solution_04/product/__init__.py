@@ -1,3 +1,4 @@
+from .catalog import ProductCatalog
 from .product import Product
 
-__all__ = ["Product"]
+__all__ = ["Product", "ProductCatalog"]
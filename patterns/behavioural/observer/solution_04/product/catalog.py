@@ -0,0 +1,27 @@
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterator
+
+from .product import Product
+
+
+@dataclass
+class ProductCatalog:
+    _products: Dict[Product, Product] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def __contains__(self, product: object) -> bool:
+        return product in self._products
+
+    def __iter__(self) -> Iterator[Product]:
+        return iter(self._products)
+
+    def get(self, name: str, brand: str, price: float) -> Product:
+        return self.intern(Product(sys.intern(name), sys.intern(brand), price))
+
+    def intern(self, product: Product) -> Product:
+        # Equal products collapse onto the first instance, so set and dict
+        # lookups on hot paths hit CPython's identity check before __eq__
+        return self._products.setdefault(product, product)
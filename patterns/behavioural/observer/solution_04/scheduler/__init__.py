@@ -0,0 +1,4 @@
+from .clock import Clock, RealClock, SimulatedClock
+from .scheduler import Scheduler
+
+__all__ = ["Clock", "RealClock", "Scheduler", "SimulatedClock"]
@@ -0,0 +1,35 @@
+import time
+from dataclasses import dataclass, field
+from typing import Protocol
+
+
+class Clock(Protocol):
+    def now(self) -> float: ...
+
+    def sleep_until(self, deadline: float) -> None: ...
+
+
+@dataclass
+class RealClock:
+    start: float = field(default_factory=time.monotonic)
+    # Real seconds per second of the clock, below 1 runs faster than real time
+    time_scale: float = 1.0
+
+    def now(self) -> float:
+        return (time.monotonic() - self.start) / self.time_scale
+
+    def sleep_until(self, deadline: float) -> None:
+        delay = deadline - self.now()
+        if delay > 0:
+            time.sleep(delay * self.time_scale)
+
+
+@dataclass
+class SimulatedClock:
+    current: float = 0.0
+
+    def now(self) -> float:
+        return self.current
+
+    def sleep_until(self, deadline: float) -> None:
+        self.current = max(self.current, deadline)
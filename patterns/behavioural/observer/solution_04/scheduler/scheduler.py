@@ -0,0 +1,36 @@
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from .clock import Clock, RealClock
+
+Event = Tuple[float, int, Callable[..., None], Tuple[Any, ...]]
+
+
+@dataclass
+class Scheduler:
+    clock: Clock = field(default_factory=RealClock)
+    _events: List[Event] = field(init=False, default_factory=list)
+    _counter: Iterator[int] = field(init=False, default_factory=itertools.count)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def schedule_at(self, due: float, action: Callable[..., None], *args: Any) -> None:
+        # The counter breaks ties so events due together fire in schedule order
+        heapq.heappush(self._events, (due, next(self._counter), action, args))
+
+    def schedule_after(
+        self, delay: float, action: Callable[..., None], *args: Any
+    ) -> None:
+        self.schedule_at(self.clock.now() + delay, action, *args)
+
+    def run(self, until: Optional[Callable[[], bool]] = None) -> None:
+        while self._events:
+            if until is not None and until():
+                return
+
+            due, _, action, args = heapq.heappop(self._events)
+            self.clock.sleep_until(due)
+            action(*args)
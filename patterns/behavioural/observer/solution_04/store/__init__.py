@@ -1,3 +1,20 @@
+from .dispatcher import Dispatcher
+from .health import SubscriberHealth, Supervisor
+from .log import Cursor, ProductLog
+from .price_index import PriceIndex
+from .sharded import ShardedStore
+from .snapshot import restore, snapshot
 from .store import Store
 
-__all__ = ["Store"]
+__all__ = [
+    "Cursor",
+    "Dispatcher",
+    "PriceIndex",
+    "ProductLog",
+    "ShardedStore",
+    "Store",
+    "SubscriberHealth",
+    "Supervisor",
+    "restore",
+    "snapshot",
+]
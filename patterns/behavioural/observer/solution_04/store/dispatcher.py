@@ -0,0 +1,72 @@
+from dataclasses import dataclass, field
+from queue import Queue
+from threading import Thread
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from .subscriber import subscriber_key
+
+Task = Optional[Tuple[Callable[..., None], Tuple[Any, ...]]]
+
+
+@dataclass
+class Dispatcher:
+    workers: int = 4
+    queue_size: int = 1024
+    errors: List[Exception] = field(default_factory=list)
+    _queues: List["Queue[Task]"] = field(init=False, default_factory=list)
+    _threads: List[Thread] = field(init=False, default_factory=list)
+    _assigned: Dict[Hashable, int] = field(init=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.workers < 1:
+            raise ValueError("A dispatcher needs at least one worker")
+
+        for index in range(self.workers):
+            # A full queue blocks submit, so a slow subscriber throttles the
+            # publisher instead of growing memory without bound
+            queue: "Queue[Task]" = Queue(maxsize=self.queue_size)
+            thread = Thread(
+                target=self._work, args=(queue,), name=f"dispatcher-{index}"
+            )
+            thread.daemon = True
+            thread.start()
+            self._queues.append(queue)
+            self._threads.append(thread)
+
+    def worker_for(self, subscriber: object) -> int:
+        # Subscribers are pinned to one worker so they see events in order, and
+        # handed out round-robin since their ids share the allocator's stride
+        key = subscriber_key(subscriber)
+        worker = self._assigned.get(key)
+        if worker is None:
+            worker = self._assigned.setdefault(key, len(self._assigned) % self.workers)
+        return worker
+
+    def submit(self, subscriber: object, task: Callable[..., None], *args: Any) -> None:
+        self._queues[self.worker_for(subscriber)].put((task, args))
+
+    def flush(self) -> None:
+        for queue in self._queues:
+            queue.join()
+
+    def close(self) -> None:
+        self.flush()
+        for queue in self._queues:
+            queue.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _work(self, queue: "Queue[Task]") -> None:
+        while True:
+            item = queue.get()
+            if item is None:
+                queue.task_done()
+                return
+
+            task, args = item
+            try:
+                task(*args)
+            except Exception as error:
+                self.errors.append(error)
+            finally:
+                queue.task_done()
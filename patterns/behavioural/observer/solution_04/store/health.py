@@ -0,0 +1,96 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .dispatcher import Dispatcher
+from .subscriber import subscriber_key
+
+
+@dataclass
+class SubscriberHealth:
+    calls: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    slow_calls: int = 0
+    skipped: int = 0
+    trips: int = 0
+    total_seconds: float = 0.0
+    demoted: bool = False
+    open_until: float = 0.0
+    last_error: Optional[Exception] = None
+
+
+@dataclass
+class Supervisor:
+    slow_threshold: float = 0.1
+    failure_threshold: int = 3
+    cooldown: float = 30.0
+    clock: Callable[[], float] = time.monotonic
+    background: Optional[Dispatcher] = None
+    health: Dict[Hashable, SubscriberHealth] = field(default_factory=dict)
+
+    def health_of(self, notifier: object) -> SubscriberHealth:
+        # One subscriber shares its health across every product it is notified of
+        return self.health.setdefault(subscriber_key(notifier), SubscriberHealth())
+
+    def run(self, notifier: object, task: Callable[..., None], *args: Any) -> None:
+        health = self.health_of(notifier)
+
+        if health.open_until > self.clock():
+            health.skipped += 1
+            return
+
+        if health.demoted:
+            if self.background is None:
+                self.background = Dispatcher(workers=1)
+            self.background.submit(notifier, self._call, health, task, args)
+            return
+
+        self._call(health, task, args)
+
+    def flush(self) -> None:
+        if self.background is not None:
+            self.background.flush()
+
+    def close(self) -> None:
+        if self.background is not None:
+            self.background.close()
+            self.background = None
+
+    def counters(self) -> Dict[str, int]:
+        now = self.clock()
+        states = self.health.values()
+        return {
+            "subscribers": len(self.health),
+            "calls": sum(health.calls for health in states),
+            "failures": sum(health.failures for health in states),
+            "slow_calls": sum(health.slow_calls for health in states),
+            "skipped": sum(health.skipped for health in states),
+            "trips": sum(health.trips for health in states),
+            "demoted": sum(health.demoted for health in states),
+            "open_circuits": sum(health.open_until > now for health in states),
+        }
+
+    def _call(
+        self, health: SubscriberHealth, task: Callable[..., None], args: Tuple[Any, ...]
+    ) -> None:
+        start = time.perf_counter()
+        try:
+            task(*args)
+        except Exception as error:
+            health.failures += 1
+            health.consecutive_failures += 1
+            health.last_error = error
+            # After a cooldown a single further failure reopens the circuit
+            if health.consecutive_failures >= self.failure_threshold:
+                health.open_until = self.clock() + self.cooldown
+                health.trips += 1
+        else:
+            health.consecutive_failures = 0
+        finally:
+            elapsed = time.perf_counter() - start
+            health.calls += 1
+            health.total_seconds += elapsed
+            if elapsed > self.slow_threshold:
+                health.slow_calls += 1
+                health.demoted = True
@@ -0,0 +1,78 @@
+import bisect
+from dataclasses import dataclass, field
+from threading import Thread
+from typing import Callable, Dict, Iterable, List, Optional
+
+from ..product import Product
+
+
+@dataclass
+class ProductLog:
+    entries: List[Product] = field(default_factory=list)
+    sequences: Dict[Product, int] = field(init=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for sequence, product in enumerate(self.entries):
+            self.sequences.setdefault(product, sequence)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def append(self, product: Product) -> int:
+        self.sequences.setdefault(product, len(self.entries))
+        self.entries.append(product)
+        return len(self.entries) - 1
+
+    def read(self, offset: int, limit: int) -> List[Product]:
+        return self.entries[offset : offset + limit]
+
+    def positions(self, products: Iterable[Product], end: int) -> List[int]:
+        positions = {self.sequences.get(product, end) for product in products}
+        return sorted(position for position in positions if position < end)
+
+
+@dataclass
+class Cursor:
+    log: ProductLog
+    wanted: Callable[[Product], bool]
+    deliver: Callable[[List[Product]], None]
+    offset: int
+    end: int
+    # Log positions of the only products wanted, when they are known up front
+    positions: Optional[List[int]] = None
+    on_caught_up: Optional[Callable[[], None]] = None
+
+    @property
+    def caught_up(self) -> bool:
+        return self.offset >= self.end
+
+    def fetch(self, page_size: int = 1000) -> int:
+        if self.positions is None:
+            page = self.log.read(self.offset, min(page_size, self.end - self.offset))
+            matches = [product for product in page if self.wanted(product)]
+            offset = self.offset + len(page)
+        else:
+            # Seek straight to the wanted products instead of reading the pages
+            first = bisect.bisect_left(self.positions, self.offset)
+            chosen = self.positions[first : first + page_size]
+            matches = [self.log.entries[position] for position in chosen]
+            rest = first + page_size < len(self.positions)
+            offset = chosen[-1] + 1 if rest else self.end
+
+        if matches:
+            self.deliver(matches)
+        # Only advance once the page is handed over, so a failure can resume
+        self.offset = offset
+        if self.caught_up and self.on_caught_up is not None:
+            on_caught_up, self.on_caught_up = self.on_caught_up, None
+            on_caught_up()
+        return len(matches)
+
+    def run(self, page_size: int = 1000) -> None:
+        while not self.caught_up:
+            self.fetch(page_size)
+
+    def start(self, page_size: int = 1000) -> Thread:
+        worker = Thread(target=self.run, args=(page_size,), daemon=True)
+        worker.start()
+        return worker
@@ -0,0 +1,119 @@
+import bisect
+import heapq
+from dataclasses import dataclass, field
+from typing import Generic, Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+Interval = Tuple[float, float, int, T]
+Entry = Tuple[int, T]
+
+# New intervals are scanned linearly until there are this many of them
+MIN_PENDING = 64
+
+
+# A segment tree over the slots between the distinct endpoints: slot 2i is the
+# endpoint itself and slot 2i + 1 the open gap up to the next one. Intervals are
+# inserted in subscription order, so every node's list is already sorted by it
+@dataclass
+class _SegmentTree(Generic[T]):
+    start: int
+    end: int
+    endpoints: List[float]
+    size: int
+    nodes: List[List[Entry[T]]]
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    @classmethod
+    def build(
+        cls, intervals: List[Interval[T]], start: int, end: int
+    ) -> "_SegmentTree[T]":
+        endpoints = sorted(
+            {bound for low, high, _, _ in intervals[start:end] for bound in (low, high)}
+        )
+        slots = {bound: 2 * position for position, bound in enumerate(endpoints)}
+        size = 1
+        while size < 2 * len(endpoints) - 1:
+            size *= 2
+
+        nodes: List[List[Entry[T]]] = [[] for _ in range(2 * size)]
+        for low, high, sequence, item in intervals[start:end]:
+            entry = (sequence, item)
+            first, last = slots[low] + size, slots[high] + size + 1
+            while first < last:
+                if first & 1:
+                    nodes[first].append(entry)
+                    first += 1
+                if last & 1:
+                    last -= 1
+                    nodes[last].append(entry)
+                first >>= 1
+                last >>= 1
+        return cls(start, end, endpoints, size, nodes)
+
+    def stab(self, price: float) -> Iterable[Entry[T]]:
+        position = bisect.bisect_left(self.endpoints, price)
+        if position < len(self.endpoints) and self.endpoints[position] == price:
+            slot = 2 * position
+        elif 0 < position < len(self.endpoints):
+            slot = 2 * position - 1
+        else:
+            return []
+
+        node = slot + self.size
+        matches = []
+        while node:
+            if self.nodes[node]:
+                matches.append(self.nodes[node])
+            node //= 2
+
+        if len(matches) == 1:
+            return matches[0]
+        # Sequences are unique, so the merge never has to compare the items
+        return heapq.merge(*matches)
+
+
+@dataclass
+class PriceIndex(Generic[T]):
+    intervals: List[Interval[T]] = field(default_factory=list)
+    _trees: List[_SegmentTree[T]] = field(init=False, default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def __contains__(self, item: object) -> bool:
+        return any(interval[3] == item for interval in self.intervals)
+
+    def add(self, low: float, high: float, item: T) -> None:
+        if low > high:
+            raise ValueError(f"Empty price range [{low}, {high}]")
+
+        self.intervals.append((low, high, len(self.intervals), item))
+
+    def stab(self, price: float) -> List[T]:
+        indexed = self._trees[-1].end if self._trees else 0
+        if len(self.intervals) - indexed >= MIN_PENDING:
+            self._index(indexed)
+            indexed = len(self.intervals)
+
+        # Every tree holds older intervals than the next one, and the pending
+        # ones are newer still, so the matches come out in subscription order
+        matches = [item for tree in self._trees for _, item in tree.stab(price)]
+        for low, high, _, item in self.intervals[indexed:]:
+            if low <= price <= high:
+                matches.append(item)
+        return matches
+
+    def _index(self, start: int) -> None:
+        self._trees.append(
+            _SegmentTree.build(self.intervals, start, len(self.intervals))
+        )
+        # Like a binary counter, a tree at least as big as the one before is
+        # merged into it, so each interval is only rebuilt O(log n) times
+        while len(self._trees) > 1 and len(self._trees[-1]) >= len(self._trees[-2]):
+            newer, older = self._trees.pop(), self._trees.pop()
+            self._trees.append(
+                _SegmentTree.build(self.intervals, older.start, newer.end)
+            )
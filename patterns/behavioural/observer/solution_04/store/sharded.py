@@ -0,0 +1,166 @@
+import math
+import os
+import pickle
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from multiprocessing.context import DefaultContext
+from multiprocessing.process import BaseProcess
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, cast
+
+from ..product import Product
+from .health import Supervisor
+from .store import NOTIFY_FUNCTION, Store
+from .subscriber import subscriber_key
+
+
+def _encode(kind: str, payload: Any) -> bytes:
+    return pickle.dumps((kind, payload), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _run_shard(connection: Connection, name: str) -> None:
+    # Like any Store, one failing subscriber must not cost the others a product
+    supervisor = Supervisor()
+    store = Store(name=name, supervisor=supervisor)
+    notifiers: Dict[int, NOTIFY_FUNCTION] = {}
+    reported: Dict[Hashable, int] = {}
+    errors: List[str] = []
+
+    while True:
+        try:
+            message = connection.recv_bytes()
+        except EOFError:
+            supervisor.close()
+            return
+
+        kind = ""
+        try:
+            kind, payload = pickle.loads(message)
+            if kind == "product":
+                store.add_product(payload)
+            elif kind == "products":
+                store.add_products(payload)
+            elif kind == "subscriber":
+                number, notifier = payload
+                notifiers[number] = notifier
+            elif kind == "subscribe":
+                number, relevant_products = payload
+                store.subscribe(notifiers[number], relevant_products)
+            elif kind == "subscribe_matching":
+                number, options = payload
+                store.subscribe_matching(notifiers[number], **options)
+        except Exception as error:
+            errors.append(f"{name}: {error!r}")
+
+        if kind == "flush":
+            store.flush()
+            for key, health in supervisor.health.items():
+                if health.failures > reported.get(key, 0):
+                    errors.append(f"{name}: {health.last_error!r}")
+                reported[key] = health.failures
+            connection.send_bytes(pickle.dumps(errors))
+            errors = []
+        elif kind == "close":
+            supervisor.close()
+            connection.close()
+            return
+
+
+@dataclass
+class ShardedStore:
+    name: str
+    shards: int = field(default_factory=lambda: os.cpu_count() or 1)
+    start_method: Optional[str] = None
+    errors: List[str] = field(default_factory=list)
+    _connections: List[Connection] = field(init=False, default_factory=list)
+    _processes: List[BaseProcess] = field(init=False, default_factory=list)
+    # The shard and the number each subscriber was sent to the shard under
+    _subscribers: Dict[Hashable, Tuple[int, int]] = field(
+        init=False, default_factory=dict
+    )
+
+    def __post_init__(self) -> None:
+        if self.shards < 1:
+            raise ValueError("A sharded store needs at least one shard")
+
+        # Every concrete context has a Process class, only BaseContext's stub lacks it
+        context = cast(DefaultContext, get_context(self.start_method))
+        for index in range(self.shards):
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_run_shard,
+                args=(child, f"{self.name}-{index}"),
+                name=f"{self.name}-shard-{index}",
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    def __enter__(self) -> "ShardedStore":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def subscribe(
+        self, notifier: NOTIFY_FUNCTION, relevant_products: List[Product]
+    ) -> None:
+        shard, number = self._place(notifier)
+        self._send(shard, _encode("subscribe", (number, relevant_products)))
+
+    def subscribe_matching(
+        self,
+        notifier: NOTIFY_FUNCTION,
+        brand: Optional[str] = None,
+        min_price: float = 0,
+        max_price: float = math.inf,
+    ) -> None:
+        options = {"brand": brand, "min_price": min_price, "max_price": max_price}
+        shard, number = self._place(notifier)
+        self._send(shard, _encode("subscribe_matching", (number, options)))
+
+    def is_subscribed(self, notifier: NOTIFY_FUNCTION) -> bool:
+        return subscriber_key(notifier) in self._subscribers
+
+    def add_product(self, product: Product) -> None:
+        self._broadcast(_encode("product", product))
+
+    def add_products(self, products: Iterable[Product]) -> None:
+        self._broadcast(_encode("products", list(products)))
+
+    def flush(self) -> None:
+        self._broadcast(_encode("flush", None))
+        for connection in self._connections:
+            self.errors.extend(pickle.loads(connection.recv_bytes()))
+
+    def close(self) -> None:
+        if not self._processes:
+            return
+
+        self.flush()
+        self._broadcast(_encode("close", None))
+        for connection, process in zip(self._connections, self._processes):
+            process.join()
+            connection.close()
+        self._connections.clear()
+        self._processes.clear()
+
+    def _place(self, notifier: NOTIFY_FUNCTION) -> Tuple[int, int]:
+        key = subscriber_key(notifier)
+        if key not in self._subscribers:
+            # Subscribers stay on one shard, which keeps the only copy of them
+            number = len(self._subscribers)
+            self._subscribers[key] = (number % self.shards, number)
+            shard, _ = self._subscribers[key]
+            self._send(shard, _encode("subscriber", (number, notifier)))
+        return self._subscribers[key]
+
+    def _send(self, shard: int, message: bytes) -> None:
+        self._connections[shard].send_bytes(message)
+
+    def _broadcast(self, message: bytes) -> None:
+        # Events are serialised once and the same bytes go to every shard
+        for connection in self._connections:
+            connection.send_bytes(message)
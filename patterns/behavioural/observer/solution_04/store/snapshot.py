@@ -0,0 +1,144 @@
+import pickle
+import struct
+import sys
+from array import array
+from collections import defaultdict
+from typing import Any, Dict, Hashable, List, Tuple, TypeVar
+
+from .log import ProductLog
+from .price_index import PriceIndex
+from .store import NOTIFY_FUNCTION, Store, subscriber_key
+
+MAGIC = b"OBSS"
+VERSION = 1
+# magic, version, metadata length, number of index keys, number of notifier ids
+HEADER = struct.Struct("<4sHQQQ")
+
+V = TypeVar("V")
+
+
+def _typecode(itemsize: int) -> str:
+    # The width of the array typecodes varies between platforms, the format does not
+    return next(code for code in "BHILQ" if array(code).itemsize == itemsize)
+
+
+# Notifier ids are 4 byte and index offsets 8 byte little endian integers
+ID = _typecode(4)
+OFFSET = _typecode(8)
+
+
+def _little_endian(values: array) -> array:
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _by_position(
+    values: Dict[Hashable, V], notifiers: List[NOTIFY_FUNCTION]
+) -> List[Tuple[int, V]]:
+    return [
+        (position, values[subscriber_key(notifier)])
+        for position, notifier in enumerate(notifiers)
+        if subscriber_key(notifier) in values
+    ]
+
+
+def _by_key(
+    values: List[Tuple[int, V]], notifiers: List[NOTIFY_FUNCTION]
+) -> Dict[Hashable, V]:
+    return {subscriber_key(notifiers[position]): value for position, value in values}
+
+
+def snapshot(store: Store) -> bytes:
+    positions: Dict[Hashable, int] = {}
+    notifiers: List[NOTIFY_FUNCTION] = []
+
+    def position(notifier: NOTIFY_FUNCTION) -> int:
+        key = subscriber_key(notifier)
+        if key not in positions:
+            positions[key] = len(notifiers)
+            notifiers.append(notifier)
+        return positions[key]
+
+    keys = list(store.product_notifiers)
+    offsets = array(OFFSET, [0])
+    ids = array(ID)
+    for key in keys:
+        ids.extend(position(notifier) for notifier in store.product_notifiers[key])
+        offsets.append(len(ids))
+
+    brands = []
+    for brand, index in store.brand_notifiers.items():
+        intervals = [
+            (low, high, position(item)) for low, high, _, item in index.intervals
+        ]
+        brands.append((brand, intervals))
+
+    metadata = pickle.dumps(
+        {
+            "name": store.name,
+            "entries": store.log.entries,
+            "keys": keys,
+            "brands": brands,
+            "notifiers": notifiers,
+            "watermarks": _by_position(store.watermarks, notifiers),
+            "priorities": _by_position(store.priorities, notifiers),
+            "exactly_once": store.exactly_once,
+            "undelivered": _by_position(store.undelivered, notifiers),
+        },
+        protocol=5,
+    )
+    header = HEADER.pack(MAGIC, VERSION, len(metadata), len(keys), len(ids))
+    return b"".join(
+        [
+            header,
+            metadata,
+            _little_endian(offsets).tobytes(),
+            _little_endian(ids).tobytes(),
+        ]
+    )
+
+
+def restore(data: bytes, **options: Any) -> Store:
+    view = memoryview(data)
+    magic, version, metadata_size, key_count, id_count = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Not an observer store snapshot")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+
+    start = HEADER.size
+    metadata = pickle.loads(view[start : start + metadata_size])
+    notifiers = metadata["notifiers"]
+    start += metadata_size
+
+    offsets = array(OFFSET)
+    offsets.frombytes(view[start : start + (key_count + 1) * offsets.itemsize])
+    start += (key_count + 1) * offsets.itemsize
+    ids = array(ID)
+    ids.frombytes(view[start : start + id_count * ids.itemsize])
+    _little_endian(offsets)
+    _little_endian(ids)
+
+    # Indexes are rebuilt directly, nothing is replayed to the subscribers
+    product_notifiers: Dict[Any, List[NOTIFY_FUNCTION]] = defaultdict(list)
+    for key, first, last in zip(metadata["keys"], offsets, offsets[1:]):
+        product_notifiers[key] = [notifiers[index] for index in ids[first:last]]
+
+    brand_notifiers: Dict[Any, PriceIndex[NOTIFY_FUNCTION]] = defaultdict(PriceIndex)
+    for brand, intervals in metadata["brands"]:
+        index = brand_notifiers[brand]
+        for low, high, notifier in intervals:
+            index.add(low, high, notifiers[notifier])
+
+    return Store(
+        name=metadata["name"],
+        products=set(metadata["entries"]),
+        log=ProductLog(list(metadata["entries"])),
+        product_notifiers=product_notifiers,
+        brand_notifiers=brand_notifiers,
+        watermarks=_by_key(metadata["watermarks"], notifiers),
+        priorities=_by_key(metadata["priorities"], notifiers),
+        undelivered=_by_key(metadata["undelivered"], notifiers),
+        **{"exactly_once": metadata["exactly_once"], **options},
+    )
@@ -1,14 +1,55 @@
+import bisect
+import heapq
+import math
 from asyncio import Protocol
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Set
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 from collections import defaultdict
 
-from ..product import Product
-
+from ..product import Product, ProductCatalog
+from .dispatcher import Dispatcher
+from .health import Supervisor
+from .log import Cursor, ProductLog
+from .price_index import PriceIndex
+from .subscriber import subscriber_key
 
 NOTIFY_FUNCTION = Callable[[Product], None]
 
 
+def notify_batch(notifier: NOTIFY_FUNCTION, products: List[Product]) -> None:
+    notify_many = getattr(notifier, "notify_many", None)
+    if notify_many is not None:
+        notify_many(products)
+        return
+
+    for product in products:
+        notifier(product)
+
+
+def notify_each(notifier: NOTIFY_FUNCTION, products: List[Product]) -> None:
+    for product in products:
+        notifier(product)
+
+
+@dataclass
+class _CatchUp:
+    cursors: int = 0
+    pending: List[Tuple[Callable[..., None], Tuple[Any, ...]]] = field(
+        default_factory=list
+    )
+
+
 @dataclass
 class Store:
     name: str
@@ -16,23 +57,334 @@ class Store:
     product_notifiers: Dict[Product, List[NOTIFY_FUNCTION]] = field(
         default_factory=lambda: defaultdict(list)
     )
+    brand_notifiers: Dict[Optional[str], PriceIndex[NOTIFY_FUNCTION]] = field(
+        default_factory=lambda: defaultdict(PriceIndex)
+    )
+    log: ProductLog = field(default_factory=ProductLog)
+    catalog: ProductCatalog = field(default_factory=ProductCatalog)
+    dispatcher: Optional[Dispatcher] = None
+    supervisor: Optional[Supervisor] = None
+    exactly_once: bool = False
+    watermarks: Dict[Hashable, int] = field(default_factory=dict)
+    priorities: Dict[Hashable, int] = field(default_factory=dict)
+    tier_dispatchers: Dict[int, Dispatcher] = field(default_factory=dict)
+    _subscriptions: Set[Tuple[Product, Hashable]] = field(
+        init=False, default_factory=set
+    )
+    _subscribers: Set[Hashable] = field(init=False, default_factory=set)
+    _catching_up: Dict[Hashable, _CatchUp] = field(init=False, default_factory=dict)
+    # Sequences sent to a subscriber whose delivery has not succeeded yet
+    undelivered: Dict[Hashable, Set[int]] = field(default_factory=dict)
+    _handoff: Lock = field(init=False, default_factory=Lock)
+
+    def __post_init__(self) -> None:
+        # The catalog hands the indexes' own instances back to later lookups
+        for product in self.products:
+            self.catalog.intern(product)
+        for product, notifiers in self.product_notifiers.items():
+            self.catalog.intern(product)
+            for notifier in notifiers:
+                self._subscriptions.add((product, subscriber_key(notifier)))
+                self._subscribers.add(subscriber_key(notifier))
+
+        for index in self.brand_notifiers.values():
+            for *_, notifier in index.intervals:
+                self._subscribers.add(subscriber_key(notifier))
 
     def subscribe(
-        self, notifier: NOTIFY_FUNCTION, relevant_products: List[Product]
+        self,
+        notifier: NOTIFY_FUNCTION,
+        relevant_products: List[Product],
+        priority: Optional[int] = None,
     ) -> None:
-        for product in relevant_products:
-            self.product_notifiers[product].append(notifier)
+        for product in self._register(notifier, relevant_products, priority):
             if product in self.products:
-                notifier(product)
+                self._send(notifier, [product], notify_each)
+        self._advance_watermark(notifier, len(self.log) - 1)
+
+    def subscribe_from(
+        self,
+        notifier: NOTIFY_FUNCTION,
+        relevant_products: List[Product],
+        offset: int = 0,
+        priority: Optional[int] = None,
+    ) -> Cursor:
+        self._register(notifier, relevant_products, priority)
+        positions = self.log.positions(relevant_products, len(self.log))
+        return self._cursor(
+            notifier, set(relevant_products).__contains__, offset, positions
+        )
+
+    def subscribe_matching(
+        self,
+        notifier: NOTIFY_FUNCTION,
+        brand: Optional[str] = None,
+        min_price: float = 0,
+        max_price: float = math.inf,
+        priority: Optional[int] = None,
+    ) -> None:
+        self.subscribe_matching_from(
+            notifier, brand, min_price, max_price, priority=priority
+        ).run()
+
+    def subscribe_matching_from(
+        self,
+        notifier: NOTIFY_FUNCTION,
+        brand: Optional[str] = None,
+        min_price: float = 0,
+        max_price: float = math.inf,
+        offset: int = 0,
+        priority: Optional[int] = None,
+    ) -> Cursor:
+        def wanted(product: Product) -> bool:
+            if brand not in (None, product.brand):
+                return False
+            return min_price <= product.price <= max_price
+
+        self._set_priority(notifier, priority)
+        self.brand_notifiers[brand].add(min_price, max_price, notifier)
+        return self._cursor(notifier, wanted, offset)
 
     def is_subscribed(self, notifier: NOTIFY_FUNCTION) -> bool:
-        all_notifiers: List[NOTIFY_FUNCTION] = sum(self.product_notifiers.values(), [])
-        return notifier in all_notifiers
+        return subscriber_key(notifier) in self._subscribers
+
+    def notifiers_for(self, product: Product) -> List[NOTIFY_FUNCTION]:
+        notifiers = self.product_notifiers.get(product, [])
+        runs = [notifiers]
+        for brand in (product.brand, None):
+            index = self.brand_notifiers.get(brand)
+            matches = [] if index is None else index.stab(product.price)
+            if matches:
+                runs.extend(self._by_priority(matches))
+
+        if len(runs) == 1:
+            return list(notifiers)
+
+        # Every run is already in rank order, and on ties the merge keeps the
+        # product subscribers first, so nothing has to be sorted again
+        unique: Dict[Hashable, NOTIFY_FUNCTION] = {}
+        for notifier in heapq.merge(*runs, key=self._rank):
+            unique.setdefault(subscriber_key(notifier), notifier)
+        return list(unique.values())
 
     def add_product(self, product: Product) -> None:
-        self.products.add(product)
-        self.notify(product)
+        self.notify(self._record(product))
+
+    def add_products(self, products: Iterable[Product]) -> None:
+        batches: Dict[Hashable, Tuple[NOTIFY_FUNCTION, List[Product]]] = {}
+        for product in products:
+            product = self._record(product)
+            for notifier in self.notifiers_for(product):
+                if not self._first_delivery(notifier, product):
+                    continue
+                key = subscriber_key(notifier)
+                _, batch = batches.setdefault(key, (notifier, []))
+                batch.append(product)
+
+        for notifier, batch in batches.values():
+            self._send(notifier, batch, notify_batch)
 
     def notify(self, product: Product) -> None:
-        for notifier in self.product_notifiers[product]:
-            notifier(product)
+        product = self.catalog.intern(product)
+        for notifier in self.notifiers_for(product):
+            if self._first_delivery(notifier, product):
+                self._send(notifier, [product], notify_each)
+
+    def flush(self) -> None:
+        if self.dispatcher is not None:
+            self.dispatcher.flush()
+        for dispatcher in self.tier_dispatchers.values():
+            dispatcher.flush()
+        if self.supervisor is not None:
+            self.supervisor.flush()
+
+    def _rank(self, notifier: NOTIFY_FUNCTION) -> int:
+        return -self.priorities.get(subscriber_key(notifier), 0)
+
+    def _by_priority(
+        self, notifiers: List[NOTIFY_FUNCTION]
+    ) -> List[List[NOTIFY_FUNCTION]]:
+        # Price matches come in subscription order, so splitting them by
+        # priority leaves one run per priority that is already in rank order
+        if not self.priorities:
+            return [notifiers]
+
+        runs: Dict[int, List[NOTIFY_FUNCTION]] = {}
+        for notifier in notifiers:
+            runs.setdefault(self._rank(notifier), []).append(notifier)
+        return list(runs.values())
+
+    def _set_priority(self, notifier: NOTIFY_FUNCTION, priority: Optional[int]) -> None:
+        key = subscriber_key(notifier)
+        if key in self._subscribers:
+            # Leaving the priority out keeps the one the subscriber already has
+            if priority not in (None, self.priorities.get(key, 0)):
+                raise ValueError(
+                    "A subscriber keeps the priority it first subscribed with"
+                )
+            return
+
+        self._subscribers.add(key)
+        if priority:
+            self.priorities[key] = priority
+
+    def _register(
+        self,
+        notifier: NOTIFY_FUNCTION,
+        relevant_products: List[Product],
+        priority: Optional[int],
+    ) -> List[Product]:
+        self._set_priority(notifier, priority)
+        key = subscriber_key(notifier)
+
+        added = []
+        for product in map(self.catalog.intern, relevant_products):
+            if (product, key) in self._subscriptions:
+                continue
+            self._subscriptions.add((product, key))
+            # Lists stay sorted by priority, then by subscription order
+            bisect.insort_right(
+                self.product_notifiers[product], notifier, key=self._rank
+            )
+            added.append(product)
+        return added
+
+    def _advance_watermark(self, notifier: NOTIFY_FUNCTION, sequence: int) -> None:
+        if self.exactly_once:
+            key = subscriber_key(notifier)
+            self.watermarks[key] = max(self.watermarks.get(key, -1), sequence)
+
+    def _first_delivery(self, notifier: NOTIFY_FUNCTION, product: Product) -> bool:
+        return not self.exactly_once or self._is_new(subscriber_key(notifier), product)
+
+    def _is_new(self, key: Hashable, product: Product) -> bool:
+        # Every product up to the watermark was either delivered live or is
+        # covered by a replay or cursor, so a re-publication is a duplicate,
+        # unless that delivery was skipped or failed
+        sequence = self.log.sequences.get(product)
+        if sequence is None:
+            return True
+        if sequence in self.undelivered.get(key, ()):
+            return True
+        return sequence > self.watermarks.get(key, -1)
+
+    def _send(
+        self,
+        notifier: NOTIFY_FUNCTION,
+        products: List[Product],
+        task: Callable[[NOTIFY_FUNCTION, List[Product]], None],
+    ) -> None:
+        if not self.exactly_once:
+            self._deliver(notifier, task, notifier, products)
+            return
+
+        key = subscriber_key(notifier)
+        sequences = self.log.sequences
+        self.undelivered.setdefault(key, set()).update(
+            sequences[product] for product in products if product in sequences
+        )
+        self._deliver(notifier, self._send_once, notifier, key, products, task)
+
+    def _send_once(
+        self,
+        notifier: NOTIFY_FUNCTION,
+        key: Hashable,
+        products: List[Product],
+        task: Callable[[NOTIFY_FUNCTION, List[Product]], None],
+    ) -> None:
+        # Checked again where the delivery runs, as a duplicate may be queued
+        # behind the first delivery of the same product
+        fresh = [product for product in products if self._is_new(key, product)]
+        if not fresh:
+            return
+
+        task(notifier, fresh)
+        # Only reached once the subscriber took the products without failing
+        sequences = self.log.sequences
+        delivered = [sequences[product] for product in fresh if product in sequences]
+        self.undelivered[key].difference_update(delivered)
+        self.watermarks[key] = max([self.watermarks.get(key, -1), *delivered])
+
+    def _record(self, product: Product) -> Product:
+        # Every product goes through the catalog, so the set and dict lookups
+        # after this one compare one shared instance by identity
+        product = self.catalog.intern(product)
+        if product not in self.products:
+            self.products.add(product)
+            self.log.append(product)
+        return product
+
+    def _cursor(
+        self,
+        notifier: NOTIFY_FUNCTION,
+        wanted: Callable[[Product], bool],
+        offset: int,
+        positions: Optional[List[int]] = None,
+    ) -> Cursor:
+        def deliver(products: List[Product]) -> None:
+            self._dispatch(notifier, notify_batch, notifier, products)
+
+        # Products published from now on reach the notifier live, so the
+        # cursor only has to cover what was already in the log
+        end = len(self.log)
+        self._advance_watermark(notifier, end - 1)
+        cursor = Cursor(self.log, wanted, deliver, offset, end, positions)
+        if cursor.caught_up:
+            return cursor
+
+        # Live products are held back until the cursor has delivered the older
+        # ones, even when it runs on its own thread
+        key = subscriber_key(notifier)
+        with self._handoff:
+            self._catching_up.setdefault(key, _CatchUp()).cursors += 1
+        cursor.on_caught_up = lambda: self._hand_off(notifier)
+        return cursor
+
+    def _hand_off(self, notifier: NOTIFY_FUNCTION) -> None:
+        key = subscriber_key(notifier)
+        with self._handoff:
+            catch_up = self._catching_up[key]
+            catch_up.cursors -= 1
+            if catch_up.cursors:
+                return
+
+        while True:
+            with self._handoff:
+                pending, catch_up.pending = catch_up.pending, []
+                if not pending:
+                    # A cursor started meanwhile takes over the hand-off
+                    if not catch_up.cursors:
+                        del self._catching_up[key]
+                    return
+
+            for task, args in pending:
+                self._dispatch(notifier, task, *args)
+
+    def _deliver(
+        self, notifier: NOTIFY_FUNCTION, task: Callable[..., None], *args: Any
+    ) -> None:
+        if self._catching_up:
+            with self._handoff:
+                catch_up = self._catching_up.get(subscriber_key(notifier))
+                if catch_up is not None:
+                    catch_up.pending.append((task, args))
+                    return
+
+        self._dispatch(notifier, task, *args)
+
+    def _dispatch(
+        self, notifier: NOTIFY_FUNCTION, task: Callable[..., None], *args: Any
+    ) -> None:
+        if self.supervisor is not None:
+            task, args = self.supervisor.run, (notifier, task, *args)
+
+        dispatcher = self.dispatcher
+        if self.tier_dispatchers:
+            priority = self.priorities.get(subscriber_key(notifier), 0)
+            dispatcher = self.tier_dispatchers.get(priority, dispatcher)
+
+        if dispatcher is None:
+            task(*args)
+            return
+
+        dispatcher.submit(notifier, task, *args)
@@ -0,0 +1,14 @@
+from typing import Hashable
+
+
+def subscriber_key(notifier: object) -> Hashable:
+    # Bound methods are rebuilt on every attribute access but hash equal,
+    # while dataclass subscribers are unhashable and keep their identity.
+    # Checking the type first skips raising for the common unhashable case
+    if type(notifier).__hash__ is None:
+        return id(notifier)
+    try:
+        hash(notifier)
+    except TypeError:
+        return id(notifier)
+    return notifier
@@ -0,0 +1,69 @@
+from typing import List
+
+from ..solution_04.customer import Customer
+from ..solution_04.product import Product
+from ..solution_04.store import Dispatcher, Store, Supervisor
+
+
+class BatchRecorder:
+    def __init__(self) -> None:
+        self.batches: List[List[Product]] = []
+
+    def __call__(self, product: Product) -> None:
+        self.batches.append([product])
+
+    def notify_many(self, products: List[Product]) -> None:
+        self.batches.append(list(products))
+
+
+def test_add_products_delivers_one_batch_per_subscriber():
+    store = Store(name="AllYouNeed")
+    products = [Product(f"Item{index}", "Brand", index) for index in range(100)]
+    recorder = BatchRecorder()
+    store.subscribe(recorder, products[::2])
+
+    store.add_products(products)
+
+    assert recorder.batches == [products[::2]]
+    assert store.products == set(products)
+
+
+def test_add_products_falls_back_to_single_notifications():
+    store = Store(name="AllYouNeed")
+    products = [Product(f"Item{index}", "Brand", index) for index in range(10)]
+    received: List[Product] = []
+    store.subscribe(received.append, products[:3])
+
+    store.add_products(products)
+
+    assert received == products[:3]
+
+
+def test_bound_methods_of_one_subscriber_share_a_batch():
+    supervisor = Supervisor()
+    store = Store(name="AllYouNeed", supervisor=supervisor)
+    products = [Product(f"Item{index}", "Brand", index) for index in range(4)]
+    received: List[Product] = []
+    # Every attribute access builds a new bound-method object
+    store.subscribe(received.append, products[:2])
+    store.subscribe(received.append, products[2:])
+
+    store.add_products(products)
+
+    assert received == products
+    assert sum(health.calls for health in supervisor.health.values()) == 1
+
+
+def test_customer_is_satisfied_by_a_batch():
+    dispatcher = Dispatcher(workers=2)
+    store = Store(name="AllYouNeed", dispatcher=dispatcher)
+    cellphone = Product("MobileX", "TechS", 300)
+    couch = Product("GiantSofa", "AllComfort", 800)
+    customer = Customer(name="Mary", interests=[cellphone, couch])
+    store.subscribe(customer, customer.interests)
+
+    store.add_products([cellphone, couch])
+    store.flush()
+    dispatcher.close()
+
+    assert customer.satisfied
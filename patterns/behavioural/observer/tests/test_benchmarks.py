@@ -0,0 +1,29 @@
+import json
+
+from ..benchmarks import fanout
+
+
+def test_fanout_benchmark_reports_every_solution(tmp_path):
+    output = tmp_path / "fanout.json"
+
+    fanout.main(
+        ["--subscribers", "20", "--products", "10", "--interests", "2"]
+        + ["--output", str(output)]
+    )
+
+    report = json.loads(output.read_text())
+    assert [result["solution"] for result in report["results"]] == [
+        "solution_01",
+        "solution_02",
+        "solution_03",
+        "solution_04",
+    ]
+    for result in report["results"]:
+        assert set(result["timings"]) == {
+            "subscribe",
+            "is_subscribed",
+            "add_product",
+            "notify",
+        }
+        assert result["timings"]["subscribe"]["operations"] == 20
+        assert result["bytes_per_subscription"] > 0
@@ -0,0 +1,43 @@
+from typing import List
+
+from ..solution_04.product import Product, ProductCatalog
+from ..solution_04.store import Store, restore, snapshot
+
+
+def test_catalog_hands_out_canonical_instances():
+    catalog = ProductCatalog()
+
+    first = catalog.get("MobileX", "TechS", 300)
+    second = catalog.get("Mobile" + "X", "TechS", 300.0)
+    built_elsewhere = catalog.intern(Product("MobileX", "TechS", 300))
+
+    assert first is second is built_elsewhere
+    assert first.name is second.name
+    assert len(catalog) == 1
+    assert Product("MobileX", "TechS", 300) in catalog
+
+
+def test_catalog_keeps_distinct_products_apart():
+    catalog = ProductCatalog()
+
+    cheap = catalog.get("MobileX", "TechS", 300)
+    expensive = catalog.get("MobileX", "TechS", 350)
+
+    assert cheap is not expensive
+    assert list(catalog) == [cheap, expensive]
+
+
+def test_store_interns_products_through_its_catalog():
+    store = Store(name="AllYouNeed")
+    inbox: List[Product] = []
+    store.subscribe(inbox.append, [Product("MobileX", "TechS", 300)])
+    store.add_products([Product("Mobile" + "X", "TechS", 300)])
+
+    subscribed = next(iter(store.product_notifiers))
+    assert inbox[0] is subscribed
+    assert store.log.entries[0] is subscribed
+    assert store.catalog.intern(Product("MobileX", "TechS", 300)) is subscribed
+
+    restored = restore(snapshot(store))
+    assert restored.log.entries[0] is next(iter(restored.product_notifiers))
+    assert len(restored.catalog) == 1
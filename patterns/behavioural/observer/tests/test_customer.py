@@ -0,0 +1,24 @@
+from ..solution_04.customer import Customer
+from ..solution_04.product import Product
+
+
+def test_customer_tracks_remaining_interests():
+    cellphone = Product("MobileX", "TechS", 300)
+    couch = Product("GiantSofa", "AllComfort", 800)
+    mug = Product("CoffeeM", "IndustrialTea", 20)
+    customer = Customer(name="Mary", interests=[couch, mug])
+
+    customer(cellphone)
+    customer(couch)
+    customer(couch)
+    assert not customer.satisfied
+    assert customer.own_products == {couch}
+
+    customer(mug)
+    assert customer.satisfied
+
+
+def test_customer_is_compact():
+    customer = Customer(name="John", interests=[])
+
+    assert not hasattr(customer, "__dict__")
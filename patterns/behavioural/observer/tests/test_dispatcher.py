@@ -0,0 +1,84 @@
+import threading
+from typing import List
+
+from ..solution_04.product import Product
+from ..solution_04.store import Dispatcher, Store
+
+
+def test_dispatcher_keeps_publish_order_per_subscriber():
+    dispatcher = Dispatcher(workers=3, queue_size=8)
+    store = Store(name="AllYouNeed", dispatcher=dispatcher)
+    products = [Product(f"Item{index}", "Brand", index) for index in range(50)]
+
+    received: List[List[Product]] = [[] for _ in range(5)]
+    for inbox in received:
+        store.subscribe(inbox.append, products)
+
+    for product in products:
+        store.add_product(product)
+    store.flush()
+    dispatcher.close()
+
+    assert all(inbox == products for inbox in received)
+
+
+def test_add_product_returns_before_slow_subscribers_finish():
+    dispatcher = Dispatcher(workers=2)
+    store = Store(name="AllYouNeed", dispatcher=dispatcher)
+    cellphone = Product("MobileX", "TechS", 300)
+    release = threading.Event()
+    received: List[Product] = []
+
+    def slow_subscriber(product: Product) -> None:
+        release.wait()
+        received.append(product)
+
+    store.subscribe(slow_subscriber, [cellphone])
+    store.add_product(cellphone)
+    assert received == []
+
+    release.set()
+    store.flush()
+    dispatcher.close()
+    assert received == [cellphone]
+
+
+def test_subscriber_errors_do_not_stop_the_worker():
+    dispatcher = Dispatcher(workers=1)
+    store = Store(name="AllYouNeed", dispatcher=dispatcher)
+    cellphone = Product("MobileX", "TechS", 300)
+    received: List[Product] = []
+
+    def failing_subscriber(product: Product) -> None:
+        raise RuntimeError(product.name)
+
+    store.subscribe(failing_subscriber, [cellphone])
+    store.subscribe(received.append, [cellphone])
+    store.add_product(cellphone)
+    store.flush()
+    dispatcher.close()
+
+    assert received == [cellphone]
+    assert [str(error) for error in dispatcher.errors] == ["MobileX"]
+
+
+def test_subscribers_are_spread_over_every_worker():
+    dispatcher = Dispatcher(workers=4)
+    inboxes: List[List[Product]] = [[] for _ in range(1_000)]
+    closures = [lambda product, inbox=inbox: inbox.append(product) for inbox in inboxes]
+
+    workers = [dispatcher.worker_for(subscriber) for subscriber in closures]
+    dispatcher.close()
+
+    assert sorted(workers.count(worker) for worker in range(4)) == [250] * 4
+
+
+def test_bound_methods_of_one_subscriber_share_a_worker():
+    dispatcher = Dispatcher(workers=4)
+    inboxes: List[List[Product]] = [[] for _ in range(8)]
+
+    for inbox in inboxes:
+        assert dispatcher.worker_for(inbox.append) == dispatcher.worker_for(
+            inbox.append
+        )
+    dispatcher.close()
@@ -0,0 +1,118 @@
+from typing import List
+
+from ..solution_04.customer import Customer
+from ..solution_04.product import Product
+from ..solution_04.store import Store, Supervisor, restore, snapshot
+
+cellphone = Product("MobileX", "TechS", 300)
+couch = Product("GiantSofa", "AllComfort", 800)
+mug = Product("CoffeeM", "IndustrialTea", 20)
+
+
+class Flaky:
+    def __init__(self) -> None:
+        self.received: List[Product] = []
+
+    def __call__(self, product: Product) -> None:
+        if product == cellphone and not self.received:
+            raise RuntimeError(product.name)
+        self.received.append(product)
+
+
+def test_subscribing_twice_is_idempotent():
+    store = Store(name="AllYouNeed")
+    received: List[Product] = []
+
+    store.subscribe(received.append, [cellphone, couch])
+    store.subscribe(received.append, [couch, mug])
+    store.subscribe_matching(received.append, brand="TechS")
+    store.add_products([cellphone, couch, mug])
+
+    assert received == [cellphone, couch, mug]
+    assert store.product_notifiers[couch] == [received.append]
+    assert store.is_subscribed(received.append)
+
+
+def test_is_subscribed_tracks_unhashable_subscribers():
+    store = Store(name="AllYouNeed")
+    john = Customer(name="John", interests=[cellphone])
+    twin = Customer(name="John", interests=[cellphone])
+
+    store.subscribe(john, john.interests)
+
+    assert store.is_subscribed(john)
+    assert not store.is_subscribed(twin)
+
+
+def test_republished_products_are_suppressed():
+    store = Store(name="AllYouNeed", exactly_once=True)
+    received: List[Product] = []
+    store.subscribe(received.append, [cellphone, couch])
+
+    store.add_product(cellphone)
+    store.add_product(couch)
+    store.add_product(cellphone)
+    store.add_products([couch, cellphone])
+
+    assert received == [cellphone, couch]
+
+
+def test_late_subscribers_receive_each_product_once():
+    store = Store(name="AllYouNeed", exactly_once=True)
+    store.add_products([cellphone, couch])
+    eager: List[Product] = []
+    lazy: List[Product] = []
+
+    store.subscribe(eager.append, [cellphone, mug])
+    cursor = store.subscribe_from(lazy.append, [cellphone, mug])
+    store.add_product(cellphone)
+    store.add_product(mug)
+    cursor.run()
+    store.add_product(mug)
+
+    assert eager == [cellphone, mug]
+    assert lazy == [cellphone, mug]
+
+
+def test_watermarks_survive_a_snapshot():
+    store = Store(name="AllYouNeed", exactly_once=True)
+    received: List[Product] = []
+    store.subscribe(received.append, [cellphone])
+    store.add_product(cellphone)
+
+    restored = restore(snapshot(store), exactly_once=True)
+    restored_notifier = restored.product_notifiers[cellphone][0]
+    restored.add_product(cellphone)
+
+    assert restored_notifier.__self__ == [cellphone]
+
+
+def test_restore_keeps_exactly_once_delivery():
+    store = Store(name="AllYouNeed", exactly_once=True)
+    received: List[Product] = []
+    store.subscribe(received.append, [cellphone])
+    store.add_product(cellphone)
+
+    restored = restore(snapshot(store))
+    restored.notify(cellphone)
+
+    assert restored.exactly_once
+    assert restored.product_notifiers[cellphone][0].__self__ == [cellphone]
+
+
+def test_skipped_deliveries_are_retried_on_republication():
+    now = [0.0]
+    supervisor = Supervisor(failure_threshold=1, cooldown=10, clock=lambda: now[0])
+    store = Store(name="AllYouNeed", supervisor=supervisor, exactly_once=True)
+    flaky = Flaky()
+    store.subscribe(flaky, [cellphone, couch, mug])
+
+    store.add_product(cellphone)
+    store.add_product(couch)
+    now[0] = 11
+    store.add_product(mug)
+    store.add_products([cellphone, couch, mug])
+    store.add_product(couch)
+
+    assert flaky.received == [mug, cellphone, couch]
+    assert store.undelivered == {flaky: set()}
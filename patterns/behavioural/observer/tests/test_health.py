@@ -0,0 +1,91 @@
+import threading
+from typing import List
+
+from ..solution_04.product import Product
+from ..solution_04.store import Store, Supervisor
+
+cellphone = Product("MobileX", "TechS", 300)
+
+
+def failing_subscriber(product: Product) -> None:
+    raise RuntimeError(product.name)
+
+
+def test_failing_subscriber_does_not_block_the_others():
+    store = Store(name="AllYouNeed", supervisor=Supervisor())
+    received: List[Product] = []
+    store.subscribe(failing_subscriber, [cellphone])
+    store.subscribe(received.append, [cellphone])
+
+    store.add_product(cellphone)
+
+    assert received == [cellphone]
+    health = store.supervisor.health_of(failing_subscriber)
+    assert health.failures == 1
+    assert str(health.last_error) == "MobileX"
+
+
+class Flaky:
+    def on(self, product: Product) -> None:
+        raise RuntimeError(product.name)
+
+
+def test_health_is_shared_across_a_subscribers_products():
+    supervisor = Supervisor(failure_threshold=3)
+    store = Store(name="AllYouNeed", supervisor=supervisor)
+    products = [Product(f"Item{index}", "Brand", index) for index in range(3)]
+    flaky = Flaky()
+    for product in products:
+        store.subscribe(flaky.on, [product])
+
+    for product in products + products:
+        store.notify(product)
+
+    health = supervisor.health_of(flaky.on)
+    assert len(supervisor.health) == 1
+    assert (health.failures, health.trips, health.skipped) == (3, 1, 3)
+
+
+def test_circuit_opens_after_repeated_failures_and_closes_after_cooldown():
+    now = [0.0]
+    supervisor = Supervisor(failure_threshold=2, cooldown=10, clock=lambda: now[0])
+    store = Store(name="AllYouNeed", supervisor=supervisor)
+    store.subscribe(failing_subscriber, [cellphone])
+
+    for _ in range(4):
+        store.notify(cellphone)
+
+    health = supervisor.health_of(failing_subscriber)
+    assert (health.calls, health.skipped, health.trips) == (2, 2, 1)
+    assert supervisor.counters()["open_circuits"] == 1
+
+    now[0] = 11
+    store.notify(cellphone)
+    store.notify(cellphone)
+    assert (health.calls, health.skipped, health.trips) == (3, 3, 2)
+
+
+def test_slow_subscriber_is_moved_to_the_background():
+    supervisor = Supervisor(slow_threshold=0.01)
+    store = Store(name="AllYouNeed", supervisor=supervisor)
+    release = threading.Event()
+    calls: List[Product] = []
+
+    def slow_subscriber(product: Product) -> None:
+        calls.append(product)
+        release.wait(0.02 if len(calls) == 1 else 5)
+
+    store.subscribe(slow_subscriber, [cellphone])
+    store.add_product(cellphone)
+    assert supervisor.health_of(slow_subscriber).demoted
+
+    store.notify(cellphone)
+    release.set()
+    store.flush()
+
+    assert calls == [cellphone, cellphone]
+    assert supervisor.counters()["slow_calls"] >= 1
+    assert supervisor.counters()["demoted"] == 1
+
+    supervisor.close()
+    assert supervisor.background is None
@@ -0,0 +1,99 @@
+import threading
+from typing import List
+
+from ..solution_04.product import Product
+from ..solution_04.store import Store
+
+products = [Product(f"Item{index}", "Brand", index) for index in range(25)]
+
+
+class Inbox:
+    def __init__(self) -> None:
+        self.batches: List[List[Product]] = []
+
+    def __call__(self, product: Product) -> None:
+        self.batches.append([product])
+
+    def notify_many(self, products: List[Product]) -> None:
+        self.batches.append(list(products))
+
+
+def test_subscribe_from_does_not_replay_synchronously():
+    store = Store(name="AllYouNeed")
+    store.add_products(products)
+    inbox = Inbox()
+
+    cursor = store.subscribe_from(inbox, products[::2])
+
+    assert inbox.batches == []
+    assert (cursor.offset, cursor.end) == (0, 25)
+
+
+def test_cursor_catches_up_in_pages_and_live_products_follow():
+    store = Store(name="AllYouNeed")
+    store.add_products(products[:20])
+    inbox = Inbox()
+    cursor = store.subscribe_from(inbox, products[::2])
+
+    store.add_product(products[20])
+    assert cursor.fetch(page_size=4) == 4
+    assert inbox.batches == [products[0:8:2]]
+    cursor.run(page_size=4)
+
+    assert cursor.caught_up
+    assert inbox.batches == [
+        products[0:8:2],
+        products[8:16:2],
+        products[16:20:2],
+        [products[20]],
+    ]
+
+
+def test_cursor_resumes_from_a_saved_offset():
+    store = Store(name="AllYouNeed")
+    store.add_products(products)
+    inbox = Inbox()
+
+    store.subscribe_from(inbox, products, offset=20).run()
+
+    assert inbox.batches == [products[20:]]
+
+
+def test_matching_cursor_runs_in_the_background():
+    store = Store(name="AllYouNeed")
+    store.add_products(products)
+    received: List[Product] = []
+
+    cursor = store.subscribe_matching_from(received.append, max_price=9)
+    cursor.start(page_size=4).join()
+
+    assert received == products[:10]
+    assert len(store.log) == 25
+
+
+def test_live_products_wait_for_a_background_catch_up():
+    store = Store(name="AllYouNeed")
+    store.add_products(products[:20])
+    published = threading.Event()
+    received: List[Product] = []
+
+    def slow_inbox(product: Product) -> None:
+        published.wait(5)
+        received.append(product)
+
+    cursor = store.subscribe_from(slow_inbox, products)
+    worker = cursor.start(page_size=4)
+    store.add_product(products[20])
+    published.set()
+    worker.join()
+
+    assert received == products[:21]
+
+
+def test_republished_products_are_logged_once():
+    store = Store(name="AllYouNeed")
+
+    store.add_product(products[0])
+    store.add_product(products[0])
+
+    assert store.log.entries == [products[0]]
@@ -0,0 +1,70 @@
+import math
+import random
+from typing import List
+
+from ..solution_04.product import Product
+from ..solution_04.store import PriceIndex, Store
+
+
+def test_stab_matches_brute_force():
+    generator = random.Random(3)
+    index: PriceIndex[int] = PriceIndex()
+    ranges = []
+    for item in range(500):
+        low = generator.uniform(0, 1000)
+        high = low + generator.uniform(0, 200)
+        ranges.append((low, high))
+        index.add(low, high, item)
+
+    for price in [generator.uniform(0, 1200) for _ in range(200)] + [0, 1000]:
+        expected = [
+            item for item, (low, high) in enumerate(ranges) if low <= price <= high
+        ]
+        assert index.stab(price) == expected
+
+
+def test_stab_stays_exact_while_intervals_are_added():
+    generator = random.Random(4)
+    index: PriceIndex[int] = PriceIndex()
+    ranges = []
+    for item in range(1_000):
+        low = float(generator.randrange(100))
+        high = low + generator.randrange(20)
+        ranges.append((low, high))
+        index.add(low, high, item)
+
+        # Queries land on endpoints, inside gaps and outside every range
+        price = generator.choice([low, high, low + 0.5, -1.0, 200.0])
+        expected = [
+            item for item, (low, high) in enumerate(ranges) if low <= price <= high
+        ]
+        assert index.stab(price) == expected
+
+
+def test_subscribe_matching_filters_by_brand_and_price():
+    store = Store(name="AllYouNeed")
+    cheap_techs: List[Product] = []
+    anything: List[Product] = []
+    store.subscribe_matching(cheap_techs.append, brand="TechS", max_price=500)
+    store.subscribe_matching(anything.append)
+
+    cellphone = Product("MobileX", "TechS", 300)
+    laptop = Product("BookPro", "TechS", 1500)
+    mug = Product("CoffeeM", "IndustrialTea", 20)
+    for product in [cellphone, laptop, mug]:
+        store.add_product(product)
+
+    assert cheap_techs == [cellphone]
+    assert anything == [cellphone, laptop, mug]
+    assert store.is_subscribed(cheap_techs.append)
+
+
+def test_subscribe_matching_replays_available_products():
+    store = Store(name="AllYouNeed")
+    couch = Product("GiantSofa", "AllComfort", 800)
+    store.add_product(couch)
+    received: List[Product] = []
+
+    store.subscribe_matching(received.append, min_price=500, max_price=math.inf)
+
+    assert received == [couch]
@@ -0,0 +1,108 @@
+import threading
+from typing import List
+
+import pytest
+
+from ..solution_04.product import Product
+from ..solution_04.store import Dispatcher, Store, restore, snapshot
+
+cellphone = Product("MobileX", "TechS", 300)
+
+
+def recorder(name: str, calls: List[str]):
+    def notify(product: Product) -> None:
+        calls.append(name)
+
+    return notify
+
+
+def test_higher_priorities_are_notified_first():
+    store = Store(name="AllYouNeed")
+    calls: List[str] = []
+
+    store.subscribe(recorder("regular-1", calls), [cellphone])
+    store.subscribe(recorder("vip", calls), [cellphone], priority=10)
+    store.subscribe(recorder("regular-2", calls), [cellphone])
+    store.subscribe(recorder("inventory", calls), [cellphone], priority=20)
+    store.subscribe_matching(recorder("vip-matching", calls), priority=10)
+    store.add_product(cellphone)
+
+    assert calls == ["inventory", "vip", "vip-matching", "regular-1", "regular-2"]
+
+
+def test_priority_is_fixed_at_first_subscription():
+    store = Store(name="AllYouNeed")
+    notifier = recorder("vip", [])
+    store.subscribe(notifier, [cellphone], priority=10)
+
+    with pytest.raises(ValueError):
+        store.subscribe(notifier, [cellphone], priority=0)
+
+
+def test_resubscribing_without_a_priority_keeps_it():
+    store = Store(name="AllYouNeed")
+    calls: List[str] = []
+    vip = recorder("vip", calls)
+    couch = Product("GiantSofa", "AllComfort", 800)
+    store.subscribe(recorder("regular", calls), [couch])
+    store.subscribe(vip, [cellphone], priority=10)
+
+    store.subscribe(vip, [couch])
+    store.add_product(couch)
+
+    assert calls == ["vip", "regular"]
+
+
+def test_matching_subscribers_are_merged_by_priority():
+    store = Store(name="AllYouNeed")
+    calls: List[str] = []
+    store.subscribe_matching(recorder("cheap", calls), max_price=500)
+    store.subscribe_matching(recorder("techs", calls), brand="TechS", priority=5)
+    store.subscribe_matching(recorder("any", calls), priority=20)
+    store.subscribe(recorder("direct", calls), [cellphone], priority=5)
+    store.add_product(cellphone)
+
+    assert calls == ["any", "direct", "techs", "cheap"]
+
+
+def test_low_priority_tier_runs_on_its_own_executor():
+    background = Dispatcher(workers=1)
+    store = Store(name="AllYouNeed", tier_dispatchers={0: background})
+    release = threading.Event()
+    calls: List[str] = []
+
+    def slow(product: Product) -> None:
+        release.wait()
+        calls.append("regular")
+
+    store.subscribe(slow, [cellphone])
+    store.subscribe(recorder("vip", calls), [cellphone], priority=10)
+    store.add_product(cellphone)
+    assert calls == ["vip"]
+
+    release.set()
+    store.flush()
+    background.close()
+    assert calls == ["vip", "regular"]
+
+
+class Named:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __call__(self, product: Product) -> None: ...
+
+
+def test_priorities_survive_a_snapshot():
+    store = Store(name="AllYouNeed")
+    store.subscribe(Named("regular"), [cellphone])
+    store.subscribe(Named("vip"), [cellphone], priority=10)
+
+    restored = restore(snapshot(store))
+    restored.subscribe(Named("late-vip"), [cellphone], priority=10)
+
+    assert [notifier.name for notifier in restored.notifiers_for(cellphone)] == [
+        "vip",
+        "late-vip",
+        "regular",
+    ]
@@ -0,0 +1,65 @@
+import random
+from typing import List, Tuple
+
+from ..solution_04.scheduler import RealClock, Scheduler, SimulatedClock
+
+
+def test_events_fire_in_due_order_at_their_due_time():
+    clock = SimulatedClock()
+    scheduler = Scheduler(clock=clock)
+    fired: List[Tuple[float, int]] = []
+    generator = random.Random(5)
+    dues = [generator.uniform(0, 100) for _ in range(5000)]
+
+    for due in dues:
+        scheduler.schedule_at(due, lambda due: fired.append((clock.now(), due)), due)
+    scheduler.run()
+
+    assert [due for _, due in fired] == sorted(dues)
+    assert all(now == due for now, due in fired)
+    assert len(scheduler) == 0
+
+
+def test_events_due_together_keep_schedule_order():
+    scheduler = Scheduler(clock=SimulatedClock())
+    fired: List[str] = []
+
+    for name in "abc":
+        scheduler.schedule_at(1, fired.append, name)
+    scheduler.run()
+
+    assert fired == ["a", "b", "c"]
+
+
+def test_run_stops_when_condition_is_met():
+    scheduler = Scheduler(clock=SimulatedClock())
+    fired: List[int] = []
+
+    for due in range(10):
+        scheduler.schedule_at(due, fired.append, due)
+    scheduler.run(until=lambda: len(fired) == 3)
+
+    assert fired == [0, 1, 2]
+    assert len(scheduler) == 7
+
+
+def test_real_clock_waits_until_due():
+    clock = RealClock()
+    scheduler = Scheduler(clock=clock)
+    fired: List[float] = []
+
+    scheduler.schedule_after(0.02, lambda: fired.append(clock.now()))
+    scheduler.run()
+
+    assert fired[0] >= 0.02
+
+
+def test_scaled_real_clock_runs_faster_than_real_time():
+    clock = RealClock(time_scale=0.01)
+    scheduler = Scheduler(clock=clock)
+    fired: List[float] = []
+
+    scheduler.schedule_after(2, lambda: fired.append(clock.now()))
+    scheduler.run()
+
+    assert fired[0] >= 2
@@ -0,0 +1,104 @@
+from multiprocessing import Manager
+from queue import Queue
+from typing import Set, Tuple
+
+from ..solution_04.product import Product
+from ..solution_04.store import ShardedStore
+
+
+class Inbox:
+    def __init__(self, name: str, queue: "Queue[Tuple[str, Product]]") -> None:
+        self.name = name
+        self.queue = queue
+
+    def __call__(self, product: Product) -> None:
+        if product.price < 0:
+            raise ValueError(product.name)
+        self.queue.put((self.name, product))
+
+
+class Collector:
+    def __init__(self, name: str, wanted: int, queue: "Queue[str]") -> None:
+        self.name = name
+        self.wanted = wanted
+        self.queue = queue
+        self.received: Set[Product] = set()
+
+    def __call__(self, product: Product) -> None:
+        self.received.add(product)
+        if len(self.received) == self.wanted:
+            self.queue.put(self.name)
+
+
+def test_products_reach_subscribers_on_every_shard():
+    cellphone = Product("MobileX", "TechS", 300)
+    couch = Product("GiantSofa", "AllComfort", 800)
+    mug = Product("CoffeeM", "IndustrialTea", 20)
+
+    with Manager() as manager, ShardedStore(name="AllYouNeed", shards=3) as store:
+        queue = manager.Queue()
+        store.subscribe(Inbox("John", queue), [cellphone])
+        store.subscribe(Inbox("Mary", queue), [couch, mug])
+        store.subscribe(Inbox("Alicia", queue), [cellphone, mug])
+        store.subscribe_matching(Inbox("Bob", queue), brand="TechS")
+
+        store.add_product(cellphone)
+        store.add_products([couch, mug])
+        store.flush()
+
+        received = set()
+        while not queue.empty():
+            received.add(queue.get())
+
+    assert received == {
+        ("John", cellphone),
+        ("Mary", couch),
+        ("Mary", mug),
+        ("Alicia", cellphone),
+        ("Alicia", mug),
+        ("Bob", cellphone),
+    }
+
+
+def test_shard_errors_are_reported_on_flush():
+    broken = Product("Broken", "TechS", -1)
+
+    with Manager() as manager, ShardedStore(name="AllYouNeed", shards=2) as store:
+        queue = manager.Queue()
+        store.subscribe(Inbox("John", queue), [broken])
+        store.add_product(broken)
+        store.flush()
+
+        assert store.errors == ["AllYouNeed-0: ValueError('Broken')"]
+
+
+def test_subscribers_stay_whole_on_one_shard():
+    cellphone = Product("MobileX", "TechS", 300)
+    couch = Product("GiantSofa", "AllComfort", 800)
+
+    with Manager() as manager, ShardedStore(name="AllYouNeed", shards=3) as store:
+        queue = manager.Queue()
+        john = Collector("John", 2, queue)
+        store.subscribe(john, [cellphone])
+        store.subscribe(john, [couch])
+        assert store.is_subscribed(john)
+        assert not store.is_subscribed(Collector("Mary", 1, queue))
+
+        store.add_products([cellphone, couch])
+        store.flush()
+
+        assert queue.get_nowait() == "John"
+
+
+def test_failing_subscribers_do_not_starve_their_shard():
+    broken = Product("Broken", "TechS", -1)
+
+    with Manager() as manager, ShardedStore(name="AllYouNeed", shards=1) as store:
+        queue = manager.Queue()
+        store.subscribe(Inbox("John", queue), [broken])
+        store.subscribe(Collector("Mary", 1, queue), [broken])
+        store.add_product(broken)
+        store.flush()
+
+        assert queue.get_nowait() == "Mary"
+        assert store.errors == ["AllYouNeed-0: ValueError('Broken')"]
@@ -0,0 +1,70 @@
+import time
+from typing import List
+
+import pytest
+
+from ..solution_04.customer import Customer
+from ..solution_04.product import Product
+from ..solution_04.store import Store, restore, snapshot
+
+cellphone = Product("MobileX", "TechS", 300)
+couch = Product("GiantSofa", "AllComfort", 800)
+mug = Product("CoffeeM", "IndustrialTea", 20)
+
+
+def test_restore_rebuilds_subscriptions_without_replaying():
+    store = Store(name="AllYouNeed")
+    john = Customer(name="John", interests=[cellphone])
+    mary = Customer(name="Mary", interests=[couch, mug])
+    store.subscribe(john, john.interests)
+    store.subscribe(mary, mary.interests)
+    store.subscribe_matching(mary, brand="TechS", max_price=500)
+    store.add_product(cellphone)
+
+    restored = restore(snapshot(store))
+    restored_john = restored.product_notifiers[cellphone][0]
+    restored_mary = restored.product_notifiers[couch][0]
+
+    assert restored.name == "AllYouNeed"
+    assert restored.products == {cellphone}
+    assert restored_john.own_products == {cellphone}
+    assert restored_mary.own_products == set()
+    assert restored.product_notifiers[mug] == [restored_mary]
+    assert restored.notifiers_for(cellphone) == [restored_john, restored_mary]
+
+    restored.add_products([couch, mug])
+    assert restored_mary.satisfied
+
+
+def test_restore_handles_large_indexes_quickly():
+    store = Store(name="AllYouNeed")
+    products = [Product(f"Item{index}", "Brand", index) for index in range(100)]
+    inboxes: List[List[Product]] = [[] for _ in range(2_000)]
+    for position, inbox in enumerate(inboxes):
+        store.subscribe(inbox.append, products[position % 100 :][:50])
+
+    start = time.perf_counter()
+    restored = restore(snapshot(store))
+
+    assert time.perf_counter() - start < 5
+    for product, notifiers in store.product_notifiers.items():
+        assert len(restored.product_notifiers[product]) == len(notifiers)
+
+
+def test_restore_rejects_unknown_data():
+    with pytest.raises(ValueError):
+        restore(b"XXXX" + bytes(64))
+
+    data = bytearray(snapshot(Store(name="AllYouNeed")))
+    data[4:6] = (2).to_bytes(2, "little")
+    with pytest.raises(ValueError, match="version 2"):
+        restore(bytes(data))
+
+
+def test_restore_keeps_the_product_log_order():
+    store = Store(name="AllYouNeed")
+    store.add_products([mug, cellphone, couch])
+
+    restored = restore(snapshot(store))
+
+    assert restored.log.entries == [mug, cellphone, couch]
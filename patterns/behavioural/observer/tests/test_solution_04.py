@@ -0,0 +1,8 @@
+from ..solution_04.main import main
+from ..solution_04.scheduler import SimulatedClock
+
+
+def test_solution_04():
+    clock = SimulatedClock()
+    main(clock)
+    assert clock.now() == 4
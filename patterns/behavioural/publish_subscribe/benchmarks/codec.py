@@ -0,0 +1,105 @@
+import argparse
+import json
+import pickle
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from ..solution_01.product import Product, ProductCodec
+
+
+class Format(NamedTuple):
+    name: str
+    encode: Callable[[List[Product]], bytes]
+    decode: Callable[[bytes], List[Product]]
+    encode_one: Callable[[Product], bytes]
+    decode_one: Callable[[bytes], Product]
+
+
+def json_encode(products: List[Product]) -> bytes:
+    return json.dumps([list(product) for product in products]).encode()
+
+
+def json_decode(data: bytes) -> List[Product]:
+    return [Product(*fields) for fields in json.loads(data)]
+
+
+def pickle_encode(message: Any) -> bytes:
+    return pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def formats() -> List[Format]:
+    codec = ProductCodec()
+    return [
+        Format("binary", codec.encode, codec.decode, codec.dumps, codec.loads),
+        Format("pickle", pickle_encode, pickle.loads, pickle_encode, pickle.loads),
+        Format(
+            "json",
+            json_encode,
+            json_decode,
+            lambda product: json.dumps(list(product)).encode(),
+            lambda data: Product(*json.loads(data)),
+        ),
+    ]
+
+
+def catalog(count: int) -> List[Product]:
+    brands = ["TechS", "AllComfort", "IndustrialTea"]
+    return [
+        Product(f"Product{index % 1000}", brands[index % len(brands)], index * 0.25)
+        for index in range(count)
+    ]
+
+
+def measure(
+    candidate: Format, products: List[Product], batch: int, repeat: int
+) -> Dict[str, Any]:
+    # Batches of one are encoded as single messages, the way a broker sends them
+    if batch == 1:
+        encode: Callable[[Any], bytes] = candidate.encode_one
+        decode: Callable[[bytes], Any] = candidate.decode_one
+        batches: List[Any] = products
+    else:
+        encode, decode = candidate.encode, candidate.decode
+        batches = [
+            products[start : start + batch] for start in range(0, len(products), batch)
+        ]
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        encoded = [encode(items) for items in batches]
+    encode_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        decoded = [decode(data) for data in encoded]
+    decode_seconds = time.perf_counter() - start
+
+    total = len(products) * repeat
+    assert decoded == batches
+    return {
+        "format": candidate.name,
+        "batch": batch,
+        "bytes_per_product": sum(map(len, encoded)) / len(products),
+        "encode_per_second": total / encode_seconds,
+        "decode_per_second": total / decode_seconds,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Product serialization benchmark")
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--batches", type=int, nargs="+", default=[1, 64, 1024])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    products = catalog(args.products)
+    results = [
+        measure(candidate, products, batch, args.repeat)
+        for batch in args.batches
+        for candidate in formats()
+    ]
+    print(json.dumps({"benchmark": "product-codec", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Tuple
+
+from ...observer.solution_04.scheduler import Clock, RealClock, SimulatedClock
+from ..problem_01.producer import Producer as PollingProducer
+from ..problem_01.product import Product as PollingProduct
+from ..problem_01.store import Store as PollingStore
+from ..solution_01.broker import Broker
+from ..solution_01.producer import Producer as PushProducer
+from ..solution_01.product import ProductKey
+
+# time of the release, index of the producer, name of the product
+Release = Tuple[float, int, str]
+
+
+@dataclass
+class Workload:
+    producers: int
+    customers: int
+    products: int
+    interests: int
+    rate: float
+    poll_interval: float
+    seed: int = 0
+
+    def releases(self) -> List[Release]:
+        generator = random.Random(self.seed)
+        releases: List[Release] = []
+        now = 0.0
+        for index in range(self.products):
+            # Releases arrive as a Poisson process of the given rate
+            now += generator.expovariate(self.rate)
+            releases.append((now, index % self.producers, f"Product{index}"))
+        return releases
+
+    def wanted(self) -> List[List[ProductKey]]:
+        generator = random.Random(self.seed + 1)
+        return [
+            [
+                (f"Product{index}", f"Brand{index % self.producers}")
+                for index in generator.sample(range(self.products), self.interests)
+            ]
+            for _ in range(self.customers)
+        ]
+
+
+@dataclass
+class Recorder:
+    clock: Clock
+    released_at: Dict[ProductKey, float] = field(default_factory=dict)
+    latencies: List[float] = field(default_factory=list)
+
+    def delivered(self, key: ProductKey, *_: Any) -> None:
+        self.latencies.append(self.clock.now() - self.released_at[key])
+
+
+class Driver(Protocol):
+    polls: bool
+
+    def release(self, producer: int, name: str) -> None: ...
+
+    def tick(self) -> None: ...
+
+
+class PollingDriver:
+    polls = True
+
+    def __init__(
+        self, workload: Workload, wanted: List[List[ProductKey]], recorder: Recorder
+    ) -> None:
+        self.recorder = recorder
+        self.producers = [
+            PollingProducer(name=f"Brand{index}") for index in range(workload.producers)
+        ]
+        self.store = PollingStore(name="bench", producers=self.producers)
+        self.waiting = [
+            [PollingProduct(name, brand, 1.0) for name, brand in keys]
+            for keys in wanted
+        ]
+
+    def release(self, producer: int, name: str) -> None:
+        self.producers[producer].release_product(name, 1.0)
+
+    def tick(self) -> None:
+        # Every customer asks the store about each interest it has not seen yet
+        for customer, products in enumerate(self.waiting):
+            remaining = []
+            for product in products:
+                if self.store.is_available(product):
+                    self.recorder.delivered((product.name, product.brand))
+                else:
+                    remaining.append(product)
+            self.waiting[customer] = remaining
+
+
+class PushDriver:
+    polls = False
+
+    def __init__(
+        self, workload: Workload, wanted: List[List[ProductKey]], recorder: Recorder
+    ) -> None:
+        broker = Broker()
+        self.producers = [
+            PushProducer(name=f"Brand{index}", broker=broker)
+            for index in range(workload.producers)
+        ]
+        for keys in wanted:
+            for name, brand in keys:
+                subscriber = partial(recorder.delivered, (name, brand))
+                broker.subscribe(f"{brand}.{name}", subscriber)
+
+    def release(self, producer: int, name: str) -> None:
+        self.producers[producer].release_product(name, 1.0)
+
+    def tick(self) -> None:
+        pass
+
+
+DRIVERS: Dict[str, Callable[[Workload, List[List[ProductKey]], Recorder], Driver]] = {
+    "polling": PollingDriver,
+    "push": PushDriver,
+}
+
+
+@dataclass
+class Result:
+    mode: str
+    clock: str
+    deliveries: int
+    expected: int
+    wall_seconds: float
+    cpu_seconds: float
+    messages_per_second: float
+    p50_ms: float
+    p99_ms: float
+    p999_ms: float
+    max_ms: float
+
+
+def percentile(ordered: Sequence[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(fraction * len(ordered)))
+    return ordered[index] * 1_000
+
+
+def run_one(
+    mode: str, workload: Workload, simulated: bool, time_scale: float
+) -> Result:
+    releases = workload.releases()
+    wanted = workload.wanted()
+    clock: Clock = SimulatedClock() if simulated else RealClock(time_scale=time_scale)
+    recorder = Recorder(clock)
+    driver = DRIVERS[mode](workload, wanted, recorder)
+
+    def release(producer: int, name: str) -> None:
+        recorder.released_at[(name, f"Brand{producer}")] = clock.now()
+        driver.release(producer, name)
+
+    # Releases sort before a poll scheduled at the same instant
+    events: List[Tuple[float, int, Callable[[], None]]] = [
+        (at, 0, partial(release, producer, name)) for at, producer, name in releases
+    ]
+    if driver.polls:
+        horizon = releases[-1][0] + workload.poll_interval
+        ticks = math.ceil(horizon / workload.poll_interval)
+        events += [
+            (tick * workload.poll_interval, 1, driver.tick)
+            for tick in range(1, ticks + 1)
+        ]
+    events.sort(key=lambda event: event[:2])
+
+    # problem_01 prints on every availability check, which is not what is measured
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        wall, cpu = time.perf_counter(), time.process_time()
+        for at, _, action in events:
+            clock.sleep_until(at)
+            action()
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+
+    ordered = sorted(recorder.latencies)
+    return Result(
+        mode=mode,
+        clock="simulated" if simulated else "real",
+        deliveries=len(ordered),
+        expected=workload.customers * workload.interests,
+        wall_seconds=wall,
+        cpu_seconds=cpu,
+        messages_per_second=len(ordered) / wall if wall else 0.0,
+        p50_ms=percentile(ordered, 0.5),
+        p99_ms=percentile(ordered, 0.99),
+        p999_ms=percentile(ordered, 0.999),
+        max_ms=ordered[-1] * 1_000 if ordered else 0.0,
+    )
+
+
+def run(
+    workload: Workload, modes: Sequence[str], simulated: bool, time_scale: float = 1.0
+) -> Dict[str, Any]:
+    return {
+        "benchmark": "pubsub-delivery",
+        "version": 1,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "workload": asdict(workload),
+        "results": [
+            asdict(run_one(mode, workload, simulated, time_scale)) for mode in modes
+        ],
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Publish/subscribe delivery benchmark")
+    parser.add_argument("--producers", type=int, default=10)
+    parser.add_argument("--customers", type=int, default=100)
+    parser.add_argument("--products", type=int, default=1_000)
+    parser.add_argument("--interests", type=int, default=5)
+    parser.add_argument("--rate", type=float, default=100.0, help="releases/second")
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--modes", nargs="+", default=list(DRIVERS))
+    parser.add_argument("--real-clock", action="store_true")
+    parser.add_argument("--time-scale", type=float, default=1.0)
+    parser.add_argument("--output", help="JSON file, defaults to stdout")
+    args = parser.parse_args(argv)
+
+    workload = Workload(
+        producers=args.producers,
+        customers=args.customers,
+        products=args.products,
+        interests=args.interests,
+        rate=args.rate,
+        poll_interval=args.poll_interval,
+        seed=args.seed,
+    )
+    report = run(workload, args.modes, not args.real_clock, args.time_scale)
+    text = json.dumps(report, indent=2, sort_keys=True)
+
+    if args.output is None:
+        print(text)
+        return
+
+    with open(args.output, "w", encoding="utf-8") as output:
+        output.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import argparse
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..solution_01.channel import RingBuffer
+
+
+def single_thread(messages: int, batch: int, capacity: int) -> Dict[str, Any]:
+    ring = RingBuffer(capacity=capacity)
+    payload = list(range(batch))
+    received = 0
+
+    start = time.perf_counter()
+    if batch == 1:
+        put = ring.put
+        # Drain whenever the ring fills up, a single thread would block otherwise
+        mask = ring.capacity - 1
+        for message in range(messages):
+            put(message)
+            if message & mask == mask:
+                received += len(ring.drain())
+    else:
+        for _ in range(messages // batch):
+            ring.put_many(payload)
+            received += len(ring.drain())
+    received += len(ring.drain())
+    elapsed = time.perf_counter() - start
+
+    return {"messages": received, "seconds": elapsed, "per_second": received / elapsed}
+
+
+def multi_producer(
+    messages: int, batch: int, capacity: int, producers: int
+) -> Dict[str, Any]:
+    ring = RingBuffer(capacity=capacity)
+    per_producer = messages // producers
+    payload = list(range(batch))
+
+    def produce() -> None:
+        for _ in range(per_producer // batch):
+            ring.put_many(payload)
+
+    threads = [threading.Thread(target=produce) for _ in range(producers)]
+    expected = producers * (per_producer // batch) * batch
+    received = 0
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    while received < expected:
+        batch_received = ring.drain()
+        if not batch_received:
+            ring.wait(0.01)
+        received += len(batch_received)
+    elapsed = time.perf_counter() - start
+
+    for thread in threads:
+        thread.join()
+    return {"messages": received, "seconds": elapsed, "per_second": received / elapsed}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Ring buffer throughput benchmark")
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--batches", type=int, nargs="+", default=[1, 64, 1024])
+    parser.add_argument("--capacity", type=int, default=65536)
+    parser.add_argument("--producers", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    results: List[Dict[str, Any]] = []
+    for batch in args.batches:
+        results.append(
+            {
+                "mode": "single_thread",
+                "batch": batch,
+                **single_thread(args.messages, batch, args.capacity),
+            }
+        )
+        results.append(
+            {
+                "mode": "multi_producer",
+                "batch": batch,
+                "producers": args.producers,
+                **multi_producer(args.messages, batch, args.capacity, args.producers),
+            }
+        )
+
+    print(json.dumps({"benchmark": "ring-buffer", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
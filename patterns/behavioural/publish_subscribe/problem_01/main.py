@@ -1,10 +1,11 @@
 import time
 from .customer import Customer
+from .producer import Producer
 from .product import Product
 from .store import Store
 
 
-def main() -> None:
+def main(time_scale: float = 1.0) -> None:
     cellphone = Product("MobileX", "TechS", 300)
     couch = Product("GiantSofa", "AllComfort", 800)
     mug = Product("CoffeeM", "IndustrialTea", 20)
@@ -18,7 +19,12 @@ def main() -> None:
     late_customer = Customer(name="bob", interests=[cellphone, couch, mug])
     late_customer_arrival = 3
 
-    store = Store(name="AllYouNeed")
+    producers = {
+        brand: Producer(name=brand)
+        for brand in ["TechS", "AllComfort", "IndustrialTea"]
+    }
+
+    store = Store(name="AllYouNeed", producers=list(producers.values()))
 
     initial_time = time.time()
 
@@ -28,11 +34,12 @@ def main() -> None:
     notification_period = 1
 
     while True:
-        current_time = time.time() - initial_time
+        current_time = (time.time() - initial_time) / time_scale
 
         for product, eta in zip(products, estimated_time_arrivals):
-            if current_time >= eta and product not in store.producers:
-                store.add_product(product)
+            producer = producers[product.brand]
+            if current_time >= eta and product not in producer.products:
+                producer.release_product(product.name, product.price)
 
         if current_time >= late_customer_arrival and late_customer not in customers:
             customers.append(late_customer)
@@ -43,7 +50,7 @@ def main() -> None:
         if all(customer.satisfied for customer in customers):
             break
 
-        time.sleep(notification_period)
+        time.sleep(notification_period * time_scale)
 
 
 if __name__ == "__main__":
@@ -1,15 +1,17 @@
 from dataclasses import dataclass, field
-from typing import List, Set
+from typing import TYPE_CHECKING, List, Set
 
-from ..store import Store
 from ..product import Product
 
+if TYPE_CHECKING:
+    from ..store import Store
+
 
 @dataclass
 class Producer:
     name: str
     products: Set[Product] = field(default_factory=set)
-    stores: List[Store] = field(default_factory=list)
+    stores: List["Store"] = field(default_factory=list)
 
     def is_available(self, product: Product) -> bool:
         if product in self.products:
@@ -10,3 +10,7 @@ class Product(NamedTuple):
         if not isinstance(other, Product):
             return False
         return other.name == self.name and other.brand == self.brand
+
+    def __hash__(self) -> int:
+        # Must agree with __eq__, so the price is left out as well
+        return hash((self.name, self.brand))
@@ -0,0 +1,13 @@
+from .async_broker import AsyncBroker, Subscription
+from .broker import Broker, MessageBroker, Subscriber
+from .topic_trie import TopicTrie, topic_matches
+
+__all__ = [
+    "AsyncBroker",
+    "Broker",
+    "MessageBroker",
+    "Subscriber",
+    "Subscription",
+    "TopicTrie",
+    "topic_matches",
+]
@@ -0,0 +1,116 @@
+import asyncio
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List
+
+from .topic_trie import TopicTrie, is_pattern, topic_matches
+
+
+# Compared by identity, so subscriptions can be found and removed again
+@dataclass(eq=False)
+class Subscription:
+    broker: "AsyncBroker"
+    topic: str
+    capacity: int
+    closed: bool = False
+    dropped: int = 0
+    _messages: Deque[Any] = field(init=False, default_factory=deque)
+    _readable: asyncio.Event = field(init=False, default_factory=asyncio.Event)
+    _writable: asyncio.Event = field(init=False, default_factory=asyncio.Event)
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Any:
+        while not self._messages:
+            if self.closed:
+                raise StopAsyncIteration
+            self._readable.clear()
+            await self._readable.wait()
+
+        message = self._messages.popleft()
+        self._writable.set()
+        return message
+
+    async def __aenter__(self) -> "Subscription":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        self.close()
+
+    @property
+    def lag(self) -> int:
+        return len(self._messages)
+
+    def offer(self, message: Any) -> bool:
+        if self.closed:
+            return True
+        if len(self._messages) >= self.capacity:
+            return False
+
+        self._messages.append(message)
+        self._readable.set()
+        return True
+
+    async def put(self, message: Any) -> None:
+        while not self.offer(message):
+            self._writable.clear()
+            await self._writable.wait()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        self.closed = True
+        self.broker.unsubscribe(self)
+        # Pending messages are dropped and everyone waiting is woken up
+        self._messages.clear()
+        self._readable.set()
+        self._writable.set()
+
+
+@dataclass
+class AsyncBroker:
+    capacity: int = 64
+    topics: Dict[str, List[Subscription]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    retained: Dict[str, Any] = field(default_factory=dict)
+    patterns: TopicTrie[Subscription] = field(default_factory=TopicTrie)
+
+    def subscribe(self, topic: str) -> Subscription:
+        subscription = Subscription(self, topic, self.capacity)
+        if is_pattern(topic):
+            self.patterns.add(topic, subscription)
+            retained = [
+                message
+                for retained_topic, message in self.retained.items()
+                if topic_matches(topic, retained_topic)
+            ]
+        else:
+            self.topics[topic].append(subscription)
+            retained = [self.retained[topic]] if topic in self.retained else []
+
+        # Nothing can wait for room yet, so retained messages past the capacity
+        # are counted as dropped instead
+        for message in retained:
+            if not subscription.offer(message):
+                subscription.dropped += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        if is_pattern(subscription.topic):
+            self.patterns.remove(subscription.topic, subscription)
+        else:
+            self.topics[subscription.topic].remove(subscription)
+
+    async def publish(self, topic: str, message: Any, retain: bool = False) -> int:
+        if retain:
+            self.retained[topic] = message
+
+        subscriptions = [*self.topics.get(topic, []), *self.patterns.match(topic)]
+        for subscription in subscriptions:
+            # Only a full subscription suspends the publisher, until it is read from
+            if not subscription.offer(message):
+                await subscription.put(message)
+        return len(subscriptions)
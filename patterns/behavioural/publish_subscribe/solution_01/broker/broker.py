@@ -0,0 +1,66 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Protocol
+
+from ..log import TopicLog
+from .topic_trie import Subscriber, TopicTrie, is_pattern, topic_matches
+
+
+class MessageBroker(Protocol):
+    def subscribe(self, topic: str, subscriber: Subscriber) -> None:
+        ...
+
+    def unsubscribe(self, topic: str, subscriber: Subscriber) -> None:
+        ...
+
+    def publish(self, topic: str, message: Any, retain: bool = False) -> int:
+        ...
+
+
+@dataclass
+class Broker:
+    topics: Dict[str, List[Subscriber]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    retained: Dict[str, Any] = field(default_factory=dict)
+    logs: Dict[str, TopicLog] = field(default_factory=dict)
+    patterns: TopicTrie[Subscriber] = field(default_factory=TopicTrie)
+
+    def subscribe(self, topic: str, subscriber: Subscriber) -> None:
+        if is_pattern(topic):
+            self.patterns.add(topic, subscriber)
+            for retained_topic, message in self.retained.items():
+                if topic_matches(topic, retained_topic):
+                    subscriber(message)
+            return
+
+        self.topics[topic].append(subscriber)
+        if topic in self.retained:
+            subscriber(self.retained[topic])
+
+    def unsubscribe(self, topic: str, subscriber: Subscriber) -> None:
+        if is_pattern(topic):
+            self.patterns.remove(topic, subscriber)
+        else:
+            self.topics[topic].remove(subscriber)
+
+    def log(self, topic: str, **options: Any) -> TopicLog:
+        if topic not in self.logs:
+            self.logs[topic] = TopicLog(topic, **options)
+        return self.logs[topic]
+
+    def publish(self, topic: str, message: Any, retain: bool = False) -> int:
+        if retain:
+            self.retained[topic] = message
+        # Logged topics keep their whole history, not only the last message
+        if topic in self.logs:
+            self.logs[topic].append(message)
+
+        # Exact topics are a dictionary lookup, patterns a walk down the trie
+        subscribers = self.topics.get(topic, [])
+        for subscriber in subscribers:
+            subscriber(message)
+        matching = self.patterns.match(topic)
+        for subscriber in matching:
+            subscriber(message)
+        return len(subscribers) + len(matching)
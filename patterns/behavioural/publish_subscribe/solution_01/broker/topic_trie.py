@@ -0,0 +1,97 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generic, List, Tuple, TypeVar
+
+Subscriber = Callable[[Any], None]
+T = TypeVar("T")
+
+# "*" matches exactly one level, "#" matches any number of trailing levels
+ONE_LEVEL = "*"
+ANY_LEVELS = "#"
+SEPARATOR = "."
+
+
+def is_pattern(topic: str) -> bool:
+    return any(level in (ONE_LEVEL, ANY_LEVELS) for level in topic.split(SEPARATOR))
+
+
+def topic_matches(pattern: str, topic: str) -> bool:
+    levels = topic.split(SEPARATOR)
+    for index, level in enumerate(pattern.split(SEPARATOR)):
+        if level == ANY_LEVELS:
+            return True
+        if index >= len(levels) or level not in (ONE_LEVEL, levels[index]):
+            return False
+    return len(pattern.split(SEPARATOR)) == len(levels)
+
+
+@dataclass
+class _Node(Generic[T]):
+    children: Dict[str, "_Node[T]"] = field(default_factory=dict)
+    subscribers: List[T] = field(default_factory=list)
+
+
+@dataclass
+class TopicTrie(Generic[T]):
+    cache_size: int = 4096
+    _root: _Node[T] = field(init=False, default_factory=_Node)
+    _cache: Dict[str, Tuple[T, ...]] = field(init=False, default_factory=dict)
+
+    def __len__(self) -> int:
+        return self._count(self._root)
+
+    def add(self, pattern: str, subscriber: T) -> None:
+        levels = pattern.split(SEPARATOR)
+        if ANY_LEVELS in levels[:-1]:
+            raise ValueError(f"'{ANY_LEVELS}' must be the last level of {pattern!r}")
+
+        node = self._root
+        for level in levels:
+            node = node.children.setdefault(level, _Node())
+        node.subscribers.append(subscriber)
+        self._cache.clear()
+
+    def remove(self, pattern: str, subscriber: T) -> None:
+        levels = pattern.split(SEPARATOR)
+        path = [self._root]
+        for level in levels:
+            path.append(path[-1].children[level])
+        path[-1].subscribers.remove(subscriber)
+        self._cache.clear()
+
+        # Prune the branch so dead patterns do not slow down routing
+        for depth in range(len(levels), 0, -1):
+            if path[depth].children or path[depth].subscribers:
+                break
+            del path[depth - 1].children[levels[depth - 1]]
+
+    def match(self, topic: str) -> Tuple[T, ...]:
+        if topic in self._cache:
+            return self._cache[topic]
+
+        matches: List[T] = []
+        self._collect(self._root, topic.split(SEPARATOR), 0, matches)
+        # A subscriber whose patterns overlap still gets each message once
+        subscribers = tuple(dict.fromkeys(matches))
+
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[topic] = subscribers
+        return subscribers
+
+    def _collect(
+        self, node: _Node[T], levels: List[str], depth: int, matches: List[T]
+    ) -> None:
+        if ANY_LEVELS in node.children:
+            matches.extend(node.children[ANY_LEVELS].subscribers)
+        if depth == len(levels):
+            matches.extend(node.subscribers)
+            return
+
+        for level in (levels[depth], ONE_LEVEL):
+            if level in node.children:
+                self._collect(node.children[level], levels, depth + 1, matches)
+
+    def _count(self, node: _Node[T]) -> int:
+        return len(node.subscribers) + sum(
+            self._count(child) for child in node.children.values()
+        )
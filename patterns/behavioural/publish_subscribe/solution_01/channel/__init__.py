@@ -0,0 +1,5 @@
+from .async_channel import AsyncRingBuffer
+from .mailbox import Mailbox, Overflow
+from .ring_buffer import RingBuffer
+
+__all__ = ["AsyncRingBuffer", "Mailbox", "Overflow", "RingBuffer"]
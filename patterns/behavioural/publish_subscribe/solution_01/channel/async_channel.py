@@ -0,0 +1,38 @@
+import asyncio
+from dataclasses import dataclass, field
+from queue import Full
+from typing import Any, List, Optional
+
+from .ring_buffer import RingBuffer
+
+
+@dataclass
+class AsyncRingBuffer:
+    ring: RingBuffer = field(default_factory=RingBuffer)
+    _loop: asyncio.AbstractEventLoop = field(init=False)
+    _ready: asyncio.Event = field(init=False, default_factory=asyncio.Event)
+
+    def __post_init__(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self.ring.wakeup = self._wake
+
+    async def put(self, item: Any) -> None:
+        try:
+            self.ring.put(item, timeout=0)
+        except Full:
+            await asyncio.to_thread(self.ring.put, item)
+
+    async def get_batch(self, max_items: Optional[int] = None) -> List[Any]:
+        while True:
+            batch = self.ring.drain(max_items)
+            if batch:
+                return batch
+
+            self._ready.clear()
+            with self.ring.parked():
+                # Producers may have published between the drain and parking
+                if not self.ring.ready():
+                    await self._ready.wait()
+
+    def _wake(self) -> None:
+        self._loop.call_soon_threadsafe(self._ready.set)
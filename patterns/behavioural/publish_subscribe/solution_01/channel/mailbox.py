@@ -0,0 +1,134 @@
+import itertools
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from operator import attrgetter
+from queue import Full
+from threading import Condition, Thread
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Literal, Optional
+
+Overflow = Literal["block", "drop_newest", "drop_oldest", "conflate"]
+
+
+# Compared by identity, so a mailbox can be unsubscribed and used as a dict key
+@dataclass(eq=False)
+class Mailbox:
+    subscriber: Callable[[Any], None]
+    capacity: int = 1024
+    overflow: Overflow = "block"
+    key: Callable[[Any], Hashable] = attrgetter("key")
+    timeout: Optional[float] = None
+    delivered: int = 0
+    dropped: int = 0
+    conflated: int = 0
+    failed: int = 0
+    last_error: Optional[Exception] = None
+    _pending: "OrderedDict[Hashable, Any]" = field(
+        init=False, default_factory=OrderedDict
+    )
+    _sequence: Iterator[int] = field(init=False, default_factory=itertools.count)
+    _changed: Condition = field(init=False, default_factory=Condition)
+    _closed: bool = field(init=False, default=False)
+    _worker: Optional[Thread] = field(init=False, default=None)
+
+    def __post_init__(self) -> None:
+        if self.capacity < 1:
+            raise ValueError("A mailbox needs room for at least one message")
+
+    def __call__(self, message: Any) -> None:
+        self.put(message)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def lag(self) -> int:
+        return len(self._pending)
+
+    def put(self, message: Any) -> bool:
+        with self._changed:
+            if self._closed:
+                # Nothing drains a closed mailbox any more
+                self.dropped += 1
+                return False
+
+            if self.overflow == "conflate":
+                key = self.key(message)
+                # Only the latest state of a product matters to the subscriber
+                if key in self._pending:
+                    self._pending[key] = message
+                    self.conflated += 1
+                    return True
+            else:
+                key = next(self._sequence)
+
+            if len(self._pending) >= self.capacity:
+                if self.overflow == "block":
+                    if not self._changed.wait_for(self._has_room, self.timeout):
+                        raise Full
+                    if self._closed:
+                        self.dropped += 1
+                        return False
+                elif self.overflow == "drop_newest":
+                    self.dropped += 1
+                    return False
+                else:
+                    self._pending.popitem(last=False)
+                    self.dropped += 1
+
+            self._pending[key] = message
+            self._changed.notify_all()
+            return True
+
+    def get_batch(
+        self, max_items: Optional[int] = None, timeout: Optional[float] = None
+    ) -> List[Any]:
+        with self._changed:
+            self._changed.wait_for(lambda: self._pending or self._closed, timeout)
+            count = len(self._pending)
+            if max_items is not None:
+                count = min(count, max_items)
+
+            batch = [self._pending.popitem(last=False)[1] for _ in range(count)]
+            self.delivered += len(batch)
+            if batch:
+                self._changed.notify_all()
+            return batch
+
+    def start(self) -> "Mailbox":
+        self._worker = Thread(target=self._run, daemon=True)
+        self._worker.start()
+        return self
+
+    def close(self) -> None:
+        with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    def counters(self) -> Dict[str, int]:
+        return {
+            "lag": self.lag,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "conflated": self.conflated,
+            "failed": self.failed,
+        }
+
+    def _has_room(self) -> bool:
+        return len(self._pending) < self.capacity or self._closed
+
+    def _run(self) -> None:
+        # Whatever is still queued when the mailbox closes is delivered first
+        while True:
+            batch = self.get_batch()
+            if not batch and self._closed:
+                return
+            for message in batch:
+                try:
+                    self.subscriber(message)
+                except Exception as error:
+                    # A dead worker would leave blocking publishers waiting forever
+                    self.failed += 1
+                    self.last_error = error
@@ -0,0 +1,147 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from queue import Full
+from threading import Condition, Lock
+from typing import Any, Callable, Iterator, List, Optional, Sequence
+
+
+@dataclass
+class RingBuffer:
+    capacity: int = 65536
+    wakeup: Optional[Callable[[], None]] = None
+    _slots: List[Any] = field(init=False)
+    _published: List[int] = field(init=False)
+    _mask: int = field(init=False)
+    _claimed: int = field(init=False, default=0)
+    _consumed: int = field(init=False, default=0)
+    _claim_lock: Lock = field(init=False, default_factory=Lock)
+    _space: Condition = field(init=False)
+    _items: Condition = field(init=False, default_factory=lambda: Condition(Lock()))
+    _producers_waiting: int = field(init=False, default=0)
+    _consumer_waiting: bool = field(init=False, default=False)
+
+    def __post_init__(self) -> None:
+        if self.capacity < 1:
+            raise ValueError("A ring buffer needs at least one slot")
+
+        # Rounding up to a power of two turns the modulo into a bit mask
+        self.capacity = 1 << (self.capacity - 1).bit_length()
+        self._mask = self.capacity - 1
+        self._slots = [None] * self.capacity
+        self._published = [-1] * self.capacity
+        self._space = Condition(self._claim_lock)
+
+    def __len__(self) -> int:
+        return self._claimed - self._consumed
+
+    def put(self, item: Any, timeout: Optional[float] = None) -> None:
+        with self._claim_lock:
+            sequence = self._claimed
+            if sequence - self._consumed < self.capacity:
+                self._claimed = sequence + 1
+            else:
+                sequence = -1
+        if sequence < 0:
+            sequence = self._claim(1, timeout)
+
+        index = sequence & self._mask
+        self._slots[index] = item
+        self._published[index] = sequence
+        if self._consumer_waiting:
+            self._signal()
+
+    def put_many(self, items: Sequence[Any], timeout: Optional[float] = None) -> None:
+        for start in range(0, len(items), self.capacity):
+            self._publish(items[start : start + self.capacity], timeout)
+
+    def drain(self, max_items: Optional[int] = None) -> List[Any]:
+        start = self._consumed
+        end = self._claimed
+        if max_items is not None:
+            end = min(end, start + max_items)
+
+        batch: List[Any] = []
+        # At most two passes: up to the end of the array, then after wrapping
+        while start < end:
+            low = start & self._mask
+            count = min(end - start, self.capacity - low)
+            expected = range(start, start + count)
+            # Producers keep writing, so the check and the cut use one snapshot
+            published = self._published[low : low + count]
+            if published != list(expected):
+                # A producer claimed these slots but has not written them yet
+                count = next(
+                    (
+                        offset
+                        for offset, sequence in enumerate(expected)
+                        if published[offset] != sequence
+                    ),
+                    count,
+                )
+
+            batch.extend(self._slots[low : low + count])
+            self._slots[low : low + count] = [None] * count
+            start += count
+            if count < len(expected):
+                break
+
+        if batch:
+            self._consumed = start
+            if self._producers_waiting:
+                with self._space:
+                    self._space.notify_all()
+        return batch
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        with self._items, self.parked():
+            return self._items.wait_for(self.ready, timeout)
+
+    @contextmanager
+    def parked(self) -> Iterator[None]:
+        # Producers only signal the consumer while it is parked
+        self._consumer_waiting = True
+        try:
+            yield
+        finally:
+            self._consumer_waiting = False
+
+    def ready(self) -> bool:
+        return self._published[self._consumed & self._mask] == self._consumed
+
+    def _claim(self, count: int, timeout: Optional[float]) -> int:
+        def has_room() -> bool:
+            return self._claimed + count - self._consumed <= self.capacity
+
+        with self._space:
+            # Only the claim is serialised, the slots are written unlocked
+            if not has_room():
+                self._producers_waiting += 1
+                try:
+                    has_space = self._space.wait_for(has_room, timeout)
+                finally:
+                    self._producers_waiting -= 1
+                if not has_space:
+                    raise Full
+            start = self._claimed
+            self._claimed += count
+        return start
+
+    def _publish(self, items: Sequence[Any], timeout: Optional[float]) -> None:
+        count = len(items)
+        start = self._claim(count, timeout)
+
+        low = start & self._mask
+        first = min(count, self.capacity - low)
+        self._slots[low : low + first] = items[:first]
+        self._slots[: count - first] = items[first:]
+        self._published[low : low + first] = range(start, start + first)
+        self._published[: count - first] = range(start + first, start + count)
+
+        if self._consumer_waiting:
+            self._signal()
+
+    def _signal(self) -> None:
+        with self._items:
+            self._items.notify()
+        if self.wakeup is not None:
+            self.wakeup()
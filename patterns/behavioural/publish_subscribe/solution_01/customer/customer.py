@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+
+from ..broker import MessageBroker
+from ..product import Product
+
+if TYPE_CHECKING:
+    from ..store import Store
+
+
+@dataclass
+class Customer:
+    name: str
+    interests: List[Product]
+    satisfied: bool = False
+    available: Set[Tuple[str, str]] = field(default_factory=set)
+
+    def subscribe(self, broker: MessageBroker) -> None:
+        for product in self.interests:
+            broker.subscribe(product.topic, self.notify)
+
+    def notify(self, product: Product) -> None:
+        print(f"I'm {self.name} and {product.name} is now available")
+        self.available.add((product.name, product.brand))
+        self.satisfied = len(self.available) == len(self.interests)
+
+    def wait_for_interests(
+        self, store: "Store", timeout: Optional[float] = None
+    ) -> bool:
+        self.satisfied = store.wait_for(self.interests, timeout)
+        return self.satisfied
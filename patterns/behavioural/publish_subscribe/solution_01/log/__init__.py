@@ -0,0 +1,5 @@
+from .consumer import Consumer, ConsumerGroup
+from .offsets import OffsetStore
+from .topic_log import Record, TopicLog
+
+__all__ = ["Consumer", "ConsumerGroup", "OffsetStore", "Record", "TopicLog"]
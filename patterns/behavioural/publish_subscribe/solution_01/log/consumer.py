@@ -0,0 +1,98 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from .offsets import OffsetStore
+from .topic_log import Record, TopicLog
+
+
+@dataclass
+class ConsumerGroup:
+    name: str
+    log: TopicLog
+    offsets: OffsetStore = field(default_factory=OffsetStore)
+    members: List[str] = field(default_factory=list)
+
+    def join(self, member: str) -> "Consumer":
+        if member not in self.members:
+            self.members.append(member)
+            self.members.sort()
+        return Consumer(self, member)
+
+    def leave(self, member: str) -> None:
+        if member in self.members:
+            self.members.remove(member)
+
+    def assignment(self, member: str) -> List[int]:
+        if member not in self.members:
+            return []
+
+        # Partitions are dealt out round robin over the sorted members
+        index = self.members.index(member)
+        return list(range(index, self.log.partitions, len(self.members)))
+
+    def committed(self) -> Dict[int, int]:
+        return self.offsets.committed(self.name, self.log.topic)
+
+    def commit(self, offsets: Dict[int, int]) -> None:
+        self.offsets.commit(self.name, self.log.topic, offsets)
+
+
+@dataclass
+class Consumer:
+    group: ConsumerGroup
+    member: str
+    positions: Dict[int, int] = field(default_factory=dict)
+    _start: int = field(init=False, default=0)
+
+    def poll(self, max_messages: int = 1000) -> List[Record]:
+        self._rebalance()
+
+        # Each poll starts one partition further on, so a busy partition cannot
+        # use up max_messages every time and starve the ones after it
+        partitions = list(self.positions)
+        if partitions:
+            start = self._start % len(partitions)
+            partitions = partitions[start:] + partitions[:start]
+            self._start = start + 1
+
+        records: List[Record] = []
+        for partition in partitions:
+            wanted = max_messages - len(records)
+            if wanted <= 0:
+                break
+
+            batch = self.group.log.read(partition, self.positions[partition], wanted)
+            if batch:
+                self.positions[partition] = batch[-1].offset + 1
+            records.extend(batch)
+        return records
+
+    def seek(self, partition: int, offset: int) -> None:
+        self._rebalance()
+        if partition not in self.positions:
+            raise ValueError(f"Partition {partition} is not assigned to {self.member}")
+        self.positions[partition] = offset
+
+    def commit(self) -> None:
+        # Partitions handed to another member since the last poll are theirs now
+        self._rebalance()
+        self.group.commit(self.positions)
+
+    def close(self) -> None:
+        self.commit()
+        self.group.leave(self.member)
+
+    def _rebalance(self) -> None:
+        assigned = self.group.assignment(self.member)
+        if set(assigned) == set(self.positions):
+            return
+
+        # Partitions taken over from another member resume at the committed offset
+        committed = self.group.committed()
+        self.positions = {
+            partition: self.positions.get(
+                partition,
+                committed.get(partition, self.group.log.start_offset(partition)),
+            )
+            for partition in assigned
+        }
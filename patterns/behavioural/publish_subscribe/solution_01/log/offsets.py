@@ -0,0 +1,43 @@
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+# group -> topic -> partition -> next offset to read
+Offsets = Dict[str, Dict[str, Dict[int, int]]]
+
+
+@dataclass
+class OffsetStore:
+    path: Optional[str] = None
+    offsets: Offsets = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.path is None or not os.path.exists(self.path):
+            return
+
+        with open(self.path) as file:
+            saved = json.load(file)
+        # JSON object keys are always strings
+        self.offsets = {
+            group: {
+                topic: {int(partition): offset for partition, offset in offsets.items()}
+                for topic, offsets in topics.items()
+            }
+            for group, topics in saved.items()
+        }
+
+    def committed(self, group: str, topic: str) -> Dict[int, int]:
+        return dict(self.offsets.get(group, {}).get(topic, {}))
+
+    def commit(self, group: str, topic: str, offsets: Dict[int, int]) -> None:
+        self.offsets.setdefault(group, {}).setdefault(topic, {}).update(offsets)
+        if self.path is not None:
+            self._save(self.path)
+
+    def _save(self, path: str) -> None:
+        # Writing aside and renaming never leaves a half written file behind
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(self.offsets, file)
+        os.replace(temporary, path)
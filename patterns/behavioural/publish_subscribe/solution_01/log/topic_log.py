@@ -0,0 +1,147 @@
+import itertools
+import sys
+import time
+import zlib
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Iterator, List, NamedTuple, Optional
+
+
+def _partition_of(key: Hashable, partitions: int) -> int:
+    # hash() of a string changes between processes, a checksum of it does not
+    data = key.encode() if isinstance(key, str) else repr(key).encode()
+    return zlib.crc32(data) % partitions
+
+
+class Record(NamedTuple):
+    partition: int
+    offset: int
+    message: Any
+
+
+@dataclass
+class Segment:
+    base_offset: int
+    messages: List[Any] = field(default_factory=list)
+    size: int = 0
+    last_appended: float = 0.0
+
+    @property
+    def next_offset(self) -> int:
+        return self.base_offset + len(self.messages)
+
+
+@dataclass
+class Partition:
+    segments: List[Segment] = field(default_factory=lambda: [Segment(0)])
+    size: int = 0
+    # Base offset of every segment, bisected to find where an offset lives
+    bases: List[int] = field(default_factory=lambda: [0])
+
+    @property
+    def start_offset(self) -> int:
+        return self.segments[0].base_offset
+
+    @property
+    def end_offset(self) -> int:
+        return self.segments[-1].next_offset
+
+    def append(self, message: Any, size: int, now: float, segment_bytes: int) -> int:
+        active = self.segments[-1]
+        if active.messages and active.size + size > segment_bytes:
+            active = Segment(active.next_offset)
+            self.segments.append(active)
+            self.bases.append(active.base_offset)
+
+        offset = active.next_offset
+        active.messages.append(message)
+        active.size += size
+        active.last_appended = now
+        self.size += size
+        return offset
+
+    def read(self, offset: int, max_messages: int) -> List[Any]:
+        offset = max(offset, self.start_offset)
+        index = bisect_right(self.bases, offset) - 1
+        messages: List[Any] = []
+        while index < len(self.segments) and len(messages) < max_messages:
+            segment = self.segments[index]
+            first = offset - segment.base_offset
+            chunk = segment.messages[first : first + max_messages - len(messages)]
+            messages.extend(chunk)
+            offset += len(chunk)
+            index += 1
+        return messages
+
+    def expire(self, max_bytes: Optional[int], oldest: Optional[float]) -> None:
+        # The active segment is never dropped, so offsets are never reused
+        while len(self.segments) > 1:
+            segment = self.segments[0]
+            too_big = max_bytes is not None and self.size > max_bytes
+            too_old = oldest is not None and segment.last_appended < oldest
+            if not (too_big or too_old):
+                return
+
+            self.segments.pop(0)
+            self.bases.pop(0)
+            self.size -= segment.size
+
+
+@dataclass
+class TopicLog:
+    topic: str
+    partitions: int = 1
+    segment_bytes: int = 1 << 20
+    retention_bytes: Optional[int] = None
+    retention_seconds: Optional[float] = None
+    partition_key: Optional[Callable[[Any], Hashable]] = None
+    sizeof: Callable[[Any], int] = sys.getsizeof
+    clock: Callable[[], float] = time.time
+    _partitions: List[Partition] = field(init=False)
+    _next_partition: Iterator[int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        if self.partitions < 1:
+            raise ValueError("A topic log needs at least one partition")
+
+        self._partitions = [Partition() for _ in range(self.partitions)]
+        self._next_partition = itertools.cycle(range(self.partitions))
+
+    def append(self, message: Any) -> Record:
+        if self.partition_key is None:
+            partition = next(self._next_partition)
+        else:
+            # Messages with the same key stay in order within one partition
+            partition = _partition_of(self.partition_key(message), self.partitions)
+
+        now = self.clock()
+        log = self._partitions[partition]
+        offset = log.append(message, self.sizeof(message), now, self.segment_bytes)
+        self._expire(log, now)
+        return Record(partition, offset, message)
+
+    def read(
+        self, partition: int, offset: int, max_messages: int = 1000
+    ) -> List[Record]:
+        log = self._partitions[partition]
+        self._expire(log, self.clock())
+        start = max(offset, log.start_offset)
+        return [
+            Record(partition, position, message)
+            for position, message in enumerate(log.read(start, max_messages), start)
+        ]
+
+    def start_offset(self, partition: int) -> int:
+        return self._partitions[partition].start_offset
+
+    def end_offset(self, partition: int) -> int:
+        return self._partitions[partition].end_offset
+
+    def segments(self, partition: int) -> int:
+        return len(self._partitions[partition].segments)
+
+    def _expire(self, log: Partition, now: float) -> None:
+        oldest = None
+        if self.retention_seconds is not None:
+            oldest = now - self.retention_seconds
+        log.expire(self.retention_bytes, oldest)
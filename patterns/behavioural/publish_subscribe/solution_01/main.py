@@ -0,0 +1,61 @@
+import time
+from functools import partial
+from typing import Callable, List, Tuple
+
+from .broker import Broker
+from .customer import Customer
+from .producer import Producer
+from .product import Product
+from .store import Store
+
+
+def main(time_scale: float = 1.0) -> None:
+    cellphone = Product("MobileX", "TechS", 300)
+    couch = Product("GiantSofa", "AllComfort", 800)
+    mug = Product("CoffeeM", "IndustrialTea", 20)
+
+    customers = [
+        Customer(name="John", interests=[cellphone]),
+        Customer(name="Mary", interests=[couch, mug]),
+        Customer(name="Alicia", interests=[cellphone, mug]),
+    ]
+
+    late_customer = Customer(name="bob", interests=[cellphone, couch, mug])
+    late_customer_arrival = 3
+
+    broker = Broker()
+
+    producers = {
+        brand: Producer(name=brand, broker=broker)
+        for brand in ["TechS", "AllComfort", "IndustrialTea"]
+    }
+
+    store = Store(name="AllYouNeed", producers=list(producers.values()))
+
+    for customer in customers:
+        customer.subscribe(broker)
+
+    products = [cellphone, couch, mug]
+    estimated_time_arrivals = [1, 2, 4]
+
+    events: List[Tuple[float, Callable[[], object]]] = []
+    for product, eta in zip(products, estimated_time_arrivals):
+        release = producers[product.brand].release_product
+        events.append((eta, partial(release, product.name, product.price)))
+    events.append((late_customer_arrival, partial(late_customer.subscribe, broker)))
+    customers.append(late_customer)
+
+    initial_time = time.monotonic()
+
+    # Nothing polls: the loop only sleeps until the next release or arrival
+    for due, event in sorted(events, key=lambda event: event[0]):
+        time.sleep(max(0.0, due * time_scale - (time.monotonic() - initial_time)))
+        event()
+
+    for product in products:
+        available = store.is_available(product)
+        print(f"{product.name} available at {store.name}: {available}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+from .client import BrokerClient, ClientPool
+from .framing import Address, JsonSerializer, PickleSerializer, Serializer
+from .server import BrokerServer
+
+__all__ = [
+    "Address",
+    "BrokerClient",
+    "BrokerServer",
+    "ClientPool",
+    "JsonSerializer",
+    "PickleSerializer",
+    "Serializer",
+]
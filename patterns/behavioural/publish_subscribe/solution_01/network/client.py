@@ -0,0 +1,187 @@
+import socket
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from queue import Empty, Queue
+from threading import Condition, Lock, Thread
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..broker import Subscriber
+from .framing import (
+    ACK,
+    MESSAGE,
+    PUBLISH,
+    RETAIN,
+    SUBSCRIBE,
+    UNSUBSCRIBE,
+    Address,
+    JsonSerializer,
+    Serializer,
+    encode,
+    open_socket,
+    parse,
+)
+
+
+@dataclass
+class BrokerClient:
+    address: Address
+    serializer: Serializer = field(default_factory=JsonSerializer)
+    send_buffer_size: int = 65536
+    subscribers: Dict[str, List[Subscriber]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    _socket: socket.socket = field(init=False)
+    _pending: bytearray = field(init=False, default_factory=bytearray)
+    _sequence: int = field(init=False, default=0)
+    _acked: int = field(init=False, default=0)
+    _closed: bool = field(init=False, default=False)
+    _send_lock: Lock = field(init=False, default_factory=Lock)
+    _acks: Condition = field(init=False, default_factory=Condition)
+    _reader: Thread = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._socket = open_socket(self.address)
+        self._socket.connect(self.address)
+        self._reader = Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def __enter__(self) -> "BrokerClient":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def publish(self, topic: str, message: Any, retain: bool = False) -> int:
+        payload = self.serializer.dumps(message)
+        # Publishes are pipelined, nothing waits for the broker until a flush
+        with self._send_lock:
+            self._sequence += 1
+            flags = RETAIN if retain else 0
+            self._pending += encode(PUBLISH, self._sequence, topic, payload, flags)
+            if len(self._pending) >= self.send_buffer_size:
+                self._send_pending()
+            return self._sequence
+
+    def subscribe(self, topic: str, subscriber: Subscriber) -> None:
+        self.subscribers[topic].append(subscriber)
+        if len(self.subscribers[topic]) == 1:
+            self._request(SUBSCRIBE, topic)
+
+    def unsubscribe(self, topic: str, subscriber: Subscriber) -> None:
+        self.subscribers[topic].remove(subscriber)
+        if not self.subscribers[topic]:
+            self._request(UNSUBSCRIBE, topic)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        with self._send_lock:
+            self._send_pending()
+            sequence = self._sequence
+
+        with self._acks:
+            acknowledged = self._acks.wait_for(
+                lambda: self._acked >= sequence or self._closed, timeout
+            )
+        if not acknowledged:
+            raise TimeoutError(f"Broker did not acknowledge message {sequence}")
+        if self._acked < sequence:
+            raise ConnectionError("Broker connection closed before acknowledging")
+
+    def close(self) -> None:
+        if not self._closed:
+            self.flush()
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._reader.join()
+        self._socket.close()
+
+    def _request(self, kind: int, topic: str) -> None:
+        with self._send_lock:
+            self._sequence += 1
+            self._pending += encode(kind, self._sequence, topic)
+        # The subscription is in place on the broker once it is acknowledged
+        self.flush()
+
+    def _send_pending(self) -> None:
+        if self._pending:
+            self._socket.sendall(self._pending)
+            self._pending.clear()
+
+    def _read(self) -> None:
+        buffer = bytearray()
+        try:
+            while True:
+                chunk = self._socket.recv(65536)
+                if not chunk:
+                    break
+
+                buffer += chunk
+                for frame in parse(buffer):
+                    if frame.kind == ACK:
+                        with self._acks:
+                            self._acked = frame.sequence
+                            self._acks.notify_all()
+                    elif frame.kind == MESSAGE:
+                        # Subscribers run on this thread and must not flush
+                        message = self.serializer.loads(frame.payload)
+                        for subscriber in list(self.subscribers.get(frame.topic, [])):
+                            subscriber(message)
+        except (OSError, ValueError):
+            pass
+        finally:
+            with self._acks:
+                self._closed = True
+                self._acks.notify_all()
+
+
+@dataclass
+class ClientPool:
+    address: Address
+    size: int = 4
+    serializer: Serializer = field(default_factory=JsonSerializer)
+    clients: List[BrokerClient] = field(default_factory=list)
+    _idle: "Queue[BrokerClient]" = field(init=False, default_factory=Queue)
+    _lock: Lock = field(init=False, default_factory=Lock)
+
+    def __enter__(self) -> "ClientPool":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    @contextmanager
+    def client(self) -> Iterator[BrokerClient]:
+        client = self._acquire()
+        try:
+            yield client
+        finally:
+            self._idle.put(client)
+
+    def publish(self, topic: str, message: Any, retain: bool = False) -> int:
+        with self.client() as client:
+            return client.publish(topic, message, retain)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        for client in list(self.clients):
+            client.flush(timeout)
+
+    def close(self) -> None:
+        for client in self.clients:
+            client.close()
+        self.clients.clear()
+
+    def _acquire(self) -> BrokerClient:
+        try:
+            return self._idle.get_nowait()
+        except Empty:
+            pass
+
+        # Connections are opened lazily, up to the size of the pool
+        with self._lock:
+            if len(self.clients) < self.size:
+                client = BrokerClient(self.address, self.serializer)
+                self.clients.append(client)
+                return client
+        return self._idle.get()
@@ -0,0 +1,99 @@
+import json
+import pickle
+import socket
+import struct
+from dataclasses import dataclass
+from typing import Any, List, NamedTuple, Protocol, Tuple, Union
+
+Address = Union[str, Tuple[str, int]]
+
+# body length, frame kind, flags, sequence number
+HEADER = struct.Struct("<IBBQ")
+TOPIC = struct.Struct("<H")
+
+PUBLISH = 1
+SUBSCRIBE = 2
+UNSUBSCRIBE = 3
+MESSAGE = 4
+ACK = 5
+
+RETAIN = 1
+
+
+class Serializer(Protocol):
+    def dumps(self, message: Any) -> bytes: ...
+
+    def loads(self, data: bytes) -> Any: ...
+
+
+class JsonSerializer:
+    def dumps(self, message: Any) -> bytes:
+        return json.dumps(message).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+# Loading a pickle can run any code, so only use it between trusted processes
+@dataclass
+class PickleSerializer:
+    protocol: int = pickle.HIGHEST_PROTOCOL
+
+    def dumps(self, message: Any) -> bytes:
+        return pickle.dumps(message, protocol=self.protocol)
+
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+class Frame(NamedTuple):
+    kind: int
+    flags: int
+    sequence: int
+    topic: str
+    payload: bytes
+
+
+def encode(
+    kind: int, sequence: int, topic: str = "", payload: bytes = b"", flags: int = 0
+) -> bytes:
+    name = topic.encode()
+    size = TOPIC.size + len(name) + len(payload)
+    return b"".join(
+        [HEADER.pack(size, kind, flags, sequence), TOPIC.pack(len(name)), name, payload]
+    )
+
+
+def parse(buffer: bytearray) -> List[Frame]:
+    frames: List[Frame] = []
+    start = 0
+    with memoryview(buffer) as view:
+        while len(buffer) - start >= HEADER.size:
+            size, kind, flags, sequence = HEADER.unpack_from(view, start)
+            end = start + HEADER.size + size
+            if end > len(buffer):
+                break
+
+            if size < TOPIC.size:
+                raise ValueError(f"Frame body of {size} bytes has no topic length")
+            body = start + HEADER.size + TOPIC.size
+            (topic_size,) = TOPIC.unpack_from(view, body - TOPIC.size)
+            if body + topic_size > end:
+                raise ValueError(f"Topic of {topic_size} bytes overruns its frame")
+            topic = str(view[body : body + topic_size], "utf-8")
+            payload = bytes(view[body + topic_size : end])
+            frames.append(Frame(kind, flags, sequence, topic, payload))
+            start = end
+
+    # Whatever is left is the start of a frame that has not fully arrived yet
+    del buffer[:start]
+    return frames
+
+
+def open_socket(address: Address) -> socket.socket:
+    if isinstance(address, str):
+        return socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return connection
@@ -0,0 +1,182 @@
+import os
+import socket
+from dataclasses import dataclass, field
+from functools import partial
+from queue import Full, Queue
+from threading import Lock, Thread
+from typing import Any, Dict, List, Optional, Set
+
+from ..broker import Broker, Subscriber
+from .framing import (
+    ACK,
+    MESSAGE,
+    PUBLISH,
+    RETAIN,
+    SUBSCRIBE,
+    UNSUBSCRIBE,
+    Address,
+    Frame,
+    encode,
+    open_socket,
+    parse,
+)
+
+
+def _forward(
+    outbound: "Queue[Optional[bytes]]",
+    connection: socket.socket,
+    topic: str,
+    payload: bytes,
+) -> None:
+    try:
+        outbound.put_nowait(encode(MESSAGE, 0, topic, payload))
+    except Full:
+        # A subscriber that falls this far behind is dropped rather than letting
+        # it stall the publisher, its own connection thread cleans up after it
+        try:
+            connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+def _write(connection: socket.socket, outbound: "Queue[Optional[bytes]]") -> None:
+    broken = False
+    while True:
+        # Whatever queued up while the last write was in progress goes out at once
+        chunks = [outbound.get()]
+        while chunks[-1] is not None and not outbound.empty() and len(chunks) < 1024:
+            chunks.append(outbound.get_nowait())
+
+        data = b"".join(chunk for chunk in chunks if chunk is not None)
+        if data and not broken:
+            try:
+                connection.sendall(data)
+            except OSError:
+                # Keep draining so the connection thread never blocks on a put
+                broken = True
+        if chunks[-1] is None:
+            return
+
+
+@dataclass
+class BrokerServer:
+    address: Address
+    broker: Broker = field(default_factory=Broker)
+    backlog: int = 128
+    outbound_size: int = 65536
+    _listener: Optional[socket.socket] = field(init=False, default=None)
+    _lock: Lock = field(init=False, default_factory=Lock)
+    _connections: Set[socket.socket] = field(init=False, default_factory=set)
+    _acceptor: Optional[Thread] = field(init=False, default=None)
+    _threads: List[Thread] = field(init=False, default_factory=list)
+
+    def __enter__(self) -> "BrokerServer":
+        return self.start()
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def start(self) -> "BrokerServer":
+        listener = open_socket(self.address)
+        if not isinstance(self.address, str):
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind(self.address)
+        listener.listen(self.backlog)
+        # Binding to port 0 picks a free port, clients need the real one
+        self.address = listener.getsockname()
+        self._listener = listener
+
+        self._acceptor = Thread(target=self._accept, args=(listener,), daemon=True)
+        self._acceptor.start()
+        return self
+
+    def close(self) -> None:
+        if self._listener is None:
+            return
+
+        self._listener.shutdown(socket.SHUT_RDWR)
+        self._listener.close()
+        self._listener = None
+        # No connection can be accepted past this point, so none is left running
+        if self._acceptor is not None:
+            self._acceptor.join()
+        with self._lock:
+            connections = list(self._connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+
+        if isinstance(self.address, str):
+            os.unlink(self.address)
+
+    def _accept(self, listener: socket.socket) -> None:
+        while True:
+            try:
+                connection, _ = listener.accept()
+            except OSError:
+                return
+
+            with self._lock:
+                self._connections.add(connection)
+            thread = Thread(target=self._serve, args=(connection,), daemon=True)
+            self._threads = [thread for thread in self._threads if thread.is_alive()]
+            self._threads.append(thread)
+            thread.start()
+
+    def _serve(self, connection: socket.socket) -> None:
+        # Only this connection's writer ever blocks on its socket, so a slow
+        # subscriber cannot hold up the broker or the other connections
+        outbound: "Queue[Optional[bytes]]" = Queue(self.outbound_size)
+        writer = Thread(target=_write, args=(connection, outbound), daemon=True)
+        writer.start()
+
+        subscriptions: Dict[str, Subscriber] = {}
+        buffer = bytearray()
+        try:
+            while True:
+                chunk = connection.recv(65536)
+                if not chunk:
+                    break
+
+                buffer += chunk
+                frames = parse(buffer)
+                with self._lock:
+                    for frame in frames:
+                        self._handle(frame, connection, outbound, subscriptions)
+
+                # A single acknowledgement covers every frame read in this chunk
+                if frames:
+                    outbound.put(encode(ACK, frames[-1].sequence))
+        except (OSError, ValueError):
+            pass
+        finally:
+            with self._lock:
+                for topic, subscriber in subscriptions.items():
+                    self.broker.unsubscribe(topic, subscriber)
+                self._connections.discard(connection)
+            outbound.put(None)
+            writer.join()
+            connection.close()
+
+    def _handle(
+        self,
+        frame: Frame,
+        connection: socket.socket,
+        outbound: "Queue[Optional[bytes]]",
+        subscriptions: Dict[str, Subscriber],
+    ) -> None:
+        if frame.kind == PUBLISH:
+            # Payloads are forwarded as they are, the server never decodes them
+            retain = bool(frame.flags & RETAIN)
+            self.broker.publish(frame.topic, frame.payload, retain)
+        elif frame.kind == SUBSCRIBE and frame.topic not in subscriptions:
+            subscriber = partial(_forward, outbound, connection, frame.topic)
+            subscriptions[frame.topic] = subscriber
+            self.broker.subscribe(frame.topic, subscriber)
+        elif frame.kind == UNSUBSCRIBE and frame.topic in subscriptions:
+            self.broker.unsubscribe(frame.topic, subscriptions.pop(frame.topic))
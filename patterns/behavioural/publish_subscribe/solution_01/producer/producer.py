@@ -0,0 +1,42 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, List, Tuple
+
+from ..broker import MessageBroker
+from ..product import Product, ProductCatalog
+
+if TYPE_CHECKING:
+    from ..store import Store
+
+
+@dataclass
+class Producer:
+    name: str
+    broker: MessageBroker
+    products: ProductCatalog = field(default_factory=ProductCatalog)
+    stores: List["Store"] = field(default_factory=list)
+
+    def release_product(self, name: str, price: float) -> Product:
+        (new_product,) = self.release_products([(name, price)])
+        return new_product
+
+    def release_products(self, items: Iterable[Tuple[str, float]]) -> List[Product]:
+        new_products = [
+            Product(name=name, brand=self.name, price=price) for name, price in items
+        ]
+        for product in new_products:
+            self.products.update(product)
+        for store in self.stores:
+            store.register(self, new_products)
+
+        for product in new_products:
+            self.broker.publish(product.topic, product, retain=True)
+        return new_products
+
+    def withdraw_product(self, name: str) -> None:
+        self.withdraw_products([name])
+
+    def withdraw_products(self, names: Iterable[str]) -> None:
+        removed = (self.products.remove(name, self.name) for name in names)
+        products = [product for product in removed if product is not None]
+        for store in self.stores:
+            store.withdraw(self, products)
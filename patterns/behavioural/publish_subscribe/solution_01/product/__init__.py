@@ -0,0 +1,5 @@
+from .catalog import Listing, ProductCatalog
+from .codec import ProductCodec
+from .product import Product, ProductKey
+
+__all__ = ["Listing", "Product", "ProductCatalog", "ProductCodec", "ProductKey"]
@@ -0,0 +1,59 @@
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional
+
+from .product import Product, ProductKey
+
+
+@dataclass(slots=True)
+class Listing:
+    name: str
+    brand: str
+    price: float
+
+    @property
+    def key(self) -> ProductKey:
+        return (self.name, self.brand)
+
+    def product(self) -> Product:
+        return Product(self.name, self.brand, self.price)
+
+
+@dataclass
+class ProductCatalog:
+    # Keys are tuples of interned strings, which cache their own hashes
+    listings: Dict[ProductKey, Listing] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.listings)
+
+    def __contains__(self, product: object) -> bool:
+        return isinstance(product, Product) and product.key in self.listings
+
+    def __iter__(self) -> Iterator[Product]:
+        return (listing.product() for listing in self.listings.values())
+
+    def update(self, product: Product) -> Listing:
+        listing = self.listings.get(product.key)
+        if listing is None:
+            name, brand = sys.intern(product.name), sys.intern(product.brand)
+            listing = self.listings[(name, brand)] = Listing(name, brand, product.price)
+        else:
+            # A new price replaces the old one instead of adding a second entry
+            listing.price = product.price
+        return listing
+
+    def get(self, name: str, brand: str) -> Optional[Product]:
+        listing = self.listings.get((name, brand))
+        return None if listing is None else listing.product()
+
+    def price_of(self, name: str, brand: str) -> Optional[float]:
+        listing = self.listings.get((name, brand))
+        return None if listing is None else listing.price
+
+    def remove(self, name: str, brand: str) -> Optional[Product]:
+        listing = self.listings.pop((name, brand), None)
+        return None if listing is None else listing.product()
+
+    def clear(self) -> None:
+        self.listings.clear()
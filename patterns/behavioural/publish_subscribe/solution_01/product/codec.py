@@ -0,0 +1,127 @@
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Dict, List, Literal, Sequence, Tuple, Union
+
+from .product import Product, ProductKey
+
+VERSION = 1
+# schema version, products, distinct (name, brand) pairs, bytes of UTF-8 text
+BATCH = struct.Struct("<BIII")
+# schema version, price, name length, brand length, then the UTF-8 name and brand
+RECORD = struct.Struct("<BdHH")
+LITTLE_ENDIAN = sys.byteorder == "little"
+
+Typecode = Literal["d", "I", "H"]
+Column = Union["memoryview[float]", "memoryview[int]", array]
+
+
+def _column(typecode: str, values: List) -> array:
+    column = array(typecode, values)
+    if not LITTLE_ENDIAN:
+        column.byteswap()
+    return column
+
+
+def _read_column(
+    typecode: Typecode, view: memoryview, position: int, count: int
+) -> Tuple[Column, int]:
+    end = position + array(typecode).itemsize * count
+    if LITTLE_ENDIAN:
+        # Casting reinterprets the bytes in place instead of copying them
+        return view[position:end].cast(typecode), end
+
+    column = array(typecode, view[position:end])
+    column.byteswap()
+    return column, end
+
+
+# A batch is laid out as columns: every price, then the index of every product in
+# the table of distinct (name, brand) pairs, then the length of each name and
+# brand in the table, and finally all of their text as a single UTF-8 string
+@dataclass
+class ProductCodec:
+    _buffer: bytearray = field(init=False, default_factory=bytearray)
+
+    def encode_into(
+        self, products: Sequence[Product], buffer: bytearray, offset: int = 0
+    ) -> int:
+        table: Dict[ProductKey, int] = {}
+        keys = [table.setdefault((p.name, p.brand), len(table)) for p in products]
+        texts = [text for key in table for text in key]
+        columns = [
+            memoryview(_column("d", [product.price for product in products])),
+            memoryview(_column("I", keys)),
+            memoryview(_column("H", [len(text) for text in texts])),
+            memoryview("".join(texts).encode()),
+        ]
+
+        end = offset + BATCH.size + sum(column.nbytes for column in columns)
+        # The buffer only ever grows, so reusing it stops allocating after warm up
+        if len(buffer) < end:
+            buffer.extend(bytes(end - len(buffer)))
+
+        counts = (len(products), len(table), columns[-1].nbytes)
+        BATCH.pack_into(buffer, offset, VERSION, *counts)
+        position = offset + BATCH.size
+        with memoryview(buffer) as view:
+            for column in columns:
+                view[position : position + column.nbytes] = column.cast("B")
+                position += column.nbytes
+        return end
+
+    def encode(self, products: Sequence[Product]) -> bytes:
+        end = self.encode_into(products, self._buffer)
+        with memoryview(self._buffer) as view:
+            return bytes(view[:end])
+
+    def decode(self, data: bytes) -> List[Product]:
+        with memoryview(data) as view:
+            products, _ = self.decode_from(view)
+        return products
+
+    def decode_from(
+        self, view: memoryview, offset: int = 0
+    ) -> Tuple[List[Product], int]:
+        version, count, distinct, text_size = BATCH.unpack_from(view, offset)
+        if version != VERSION:
+            raise ValueError(f"Unsupported product batch version {version}")
+
+        prices, position = _read_column("d", view, offset + BATCH.size, count)
+        keys, position = _read_column("I", view, position, count)
+        lengths, position = _read_column("H", view, position, 2 * distinct)
+        # All the text is decoded at once, straight out of the view
+        text = str(view[position : position + text_size], "utf-8")
+        position += text_size
+
+        bounds = list(accumulate(lengths.tolist(), initial=0))
+        texts = [text[start:end] for start, end in zip(bounds, bounds[1:])]
+        table = list(zip(texts[::2], texts[1::2]))
+
+        # Building the tuples directly skips the slower NamedTuple constructor
+        new = tuple.__new__
+        products = [
+            new(Product, table[key] + (price,))
+            for key, price in zip(keys.tolist(), prices.tolist())
+        ]
+        return products, position
+
+    def dumps(self, product: Product) -> bytes:
+        # A single product skips the columns, their setup dominates at this size
+        name, brand = product.name.encode(), product.brand.encode()
+        header = RECORD.pack(VERSION, product.price, len(name), len(brand))
+        return header + name + brand
+
+    def loads(self, data: bytes) -> Product:
+        version, price, name_size, brand_size = RECORD.unpack_from(data)
+        if version != VERSION:
+            raise ValueError(f"Unsupported product record version {version}")
+
+        start = RECORD.size
+        with memoryview(data) as view:
+            name = str(view[start : start + name_size], "utf-8")
+            start += name_size
+            brand = str(view[start : start + brand_size], "utf-8")
+        return tuple.__new__(Product, (name, brand, price))
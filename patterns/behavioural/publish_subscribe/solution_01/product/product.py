@@ -0,0 +1,17 @@
+from typing import NamedTuple, Tuple
+
+ProductKey = Tuple[str, str]
+
+
+class Product(NamedTuple):
+    name: str
+    brand: str
+    price: float
+
+    @property
+    def topic(self) -> str:
+        return f"{self.brand}.{self.name}"
+
+    @property
+    def key(self) -> ProductKey:
+        return (self.name, self.brand)
@@ -0,0 +1,129 @@
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+from threading import Condition, Lock
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from ..producer import Producer
+from ..product import Product, ProductKey
+
+
+@dataclass(eq=False)
+class _Waiter:
+    keys: Set[ProductKey]
+    missing: Set[ProductKey]
+    wake: Callable[[], None]
+
+
+@dataclass
+class Store:
+    name: str
+    producers: List[Producer] = field(default_factory=list)
+    availability: Dict[ProductKey, Dict[str, Producer]] = field(
+        default_factory=lambda: defaultdict(dict)
+    )
+    _lock: Lock = field(init=False, default_factory=Lock)
+    _waiters: Dict[ProductKey, List[_Waiter]] = field(
+        init=False, default_factory=lambda: defaultdict(list)
+    )
+
+    def __post_init__(self) -> None:
+        producers, self.producers = self.producers, []
+        for producer in producers:
+            self.add_producer(producer)
+
+    def add_producer(self, producer: Producer) -> None:
+        self.producers.append(producer)
+        producer.stores.append(self)
+        self.register(producer, producer.products)
+
+    def register(self, producer: Producer, products: Iterable[Product]) -> None:
+        with self._lock:
+            for product in products:
+                self.availability[product.key][producer.name] = producer
+                # Waiters are only woken once the last product they need arrives
+                for waiter in self._waiters.get(product.key, []):
+                    if product.key in waiter.missing:
+                        waiter.missing.discard(product.key)
+                        if not waiter.missing:
+                            waiter.wake()
+
+    def withdraw(self, producer: Producer, products: Iterable[Product]) -> None:
+        with self._lock:
+            for product in products:
+                carriers = self.availability.get(product.key, {})
+                carriers.pop(producer.name, None)
+                if not carriers:
+                    self.availability.pop(product.key, None)
+                    for waiter in self._waiters.get(product.key, []):
+                        waiter.missing.add(product.key)
+
+    def is_available(self, product: Product) -> bool:
+        return product.key in self.availability
+
+    def carriers(self, product: Product) -> List[Producer]:
+        return list(self.availability.get(product.key, {}).values())
+
+    def price_of(self, product: Product) -> Optional[float]:
+        prices = [
+            producer.products.price_of(product.name, product.brand)
+            for producer in self.carriers(product)
+        ]
+        return min((price for price in prices if price is not None), default=None)
+
+    def wait_for(
+        self, products: Iterable[Product], timeout: Optional[float] = None
+    ) -> bool:
+        with self._lock:
+            condition = Condition(self._lock)
+            waiter = self._add_waiter(products, condition.notify)
+            try:
+                return condition.wait_for(lambda: not waiter.missing, timeout)
+            finally:
+                self._remove_waiter(waiter)
+
+    async def wait_for_async(
+        self, products: Iterable[Product], timeout: Optional[float] = None
+    ) -> bool:
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+
+        # Products may be released from other threads than the event loop's
+        def wake() -> None:
+            loop.call_soon_threadsafe(ready.set)
+
+        with self._lock:
+            waiter = self._add_waiter(products, wake)
+
+        deadline = None if timeout is None else loop.time() + timeout
+        try:
+            while True:
+                with self._lock:
+                    if not waiter.missing:
+                        return True
+                    ready.clear()
+
+                remaining = None if deadline is None else deadline - loop.time()
+                try:
+                    await asyncio.wait_for(ready.wait(), remaining)
+                except asyncio.TimeoutError:
+                    return False
+        finally:
+            with self._lock:
+                self._remove_waiter(waiter)
+
+    def _add_waiter(
+        self, products: Iterable[Product], wake: Callable[[], None]
+    ) -> _Waiter:
+        keys = {product.key for product in products}
+        missing = {key for key in keys if key not in self.availability}
+        waiter = _Waiter(keys, missing, wake)
+        for key in keys:
+            self._waiters[key].append(waiter)
+        return waiter
+
+    def _remove_waiter(self, waiter: _Waiter) -> None:
+        for key in waiter.keys:
+            self._waiters[key].remove(waiter)
+            if not self._waiters[key]:
+                del self._waiters[key]
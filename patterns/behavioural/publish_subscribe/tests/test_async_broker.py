@@ -0,0 +1,115 @@
+import asyncio
+from typing import List
+
+from ..solution_01.broker import AsyncBroker, Subscription
+from ..solution_01.product import Product
+
+CELLPHONE = Product("MobileX", "TechS", 300)
+
+
+async def take(subscription: Subscription, count: int) -> List[Product]:
+    received: List[Product] = []
+    async for product in subscription:
+        received.append(product)
+        if len(received) == count:
+            break
+    return received
+
+
+def test_subscriptions_are_async_iterators():
+    async def scenario() -> List[Product]:
+        broker = AsyncBroker()
+        async with broker.subscribe(CELLPHONE.topic) as subscription:
+            consumer = asyncio.create_task(take(subscription, 2))
+            assert await broker.publish(CELLPHONE.topic, CELLPHONE) == 1
+            await broker.publish(CELLPHONE.topic, CELLPHONE._replace(price=280))
+            received = await consumer
+
+        assert await broker.publish(CELLPHONE.topic, CELLPHONE) == 0
+        return received
+
+    assert [product.price for product in asyncio.run(scenario())] == [300, 280]
+
+
+def test_full_subscriptions_hold_back_the_publisher():
+    async def scenario() -> None:
+        broker = AsyncBroker(capacity=2)
+        subscription = broker.subscribe(CELLPHONE.topic)
+
+        async def publish_all() -> None:
+            for price in range(5):
+                await broker.publish(CELLPHONE.topic, CELLPHONE._replace(price=price))
+
+        publisher = asyncio.create_task(publish_all())
+        await asyncio.sleep(0)
+        assert not publisher.done()
+        assert subscription.lag == 2
+
+        received = await take(subscription, 5)
+        await publisher
+        assert [product.price for product in received] == list(range(5))
+
+    asyncio.run(scenario())
+
+
+def test_closing_a_subscription_releases_a_blocked_publisher():
+    async def scenario() -> None:
+        broker = AsyncBroker(capacity=1)
+        subscription = broker.subscribe(CELLPHONE.topic)
+        await broker.publish(CELLPHONE.topic, CELLPHONE)
+
+        publisher = asyncio.create_task(broker.publish(CELLPHONE.topic, CELLPHONE))
+        await asyncio.sleep(0)
+        subscription.close()
+
+        assert await asyncio.wait_for(publisher, 1) == 1
+        assert await take(subscription, 1) == []
+
+    asyncio.run(scenario())
+
+
+def test_patterns_and_retained_releases():
+    async def scenario() -> List[Product]:
+        broker = AsyncBroker()
+        await broker.publish(CELLPHONE.topic, CELLPHONE, retain=True)
+        subscription = broker.subscribe("TechS.*")
+        await broker.publish("TechS.Tablet", Product("Tablet", "TechS", 500))
+        return await take(subscription, 2)
+
+    assert [product.name for product in asyncio.run(scenario())] == [
+        "MobileX",
+        "Tablet",
+    ]
+
+
+def test_retained_messages_past_the_capacity_are_counted_as_dropped():
+    async def scenario() -> None:
+        broker = AsyncBroker(capacity=2)
+        for name in ["MobileX", "Tablet", "Laptop"]:
+            await broker.publish(f"TechS.{name}", Product(name, "TechS", 300), True)
+
+        subscription = broker.subscribe("TechS.*")
+        assert (subscription.lag, subscription.dropped) == (2, 1)
+        assert [product.name for product in await take(subscription, 2)] == [
+            "MobileX",
+            "Tablet",
+        ]
+
+    asyncio.run(scenario())
+
+
+def test_one_loop_serves_many_subscribers():
+    subscribers, messages = 10_000, 3
+
+    async def scenario() -> int:
+        broker = AsyncBroker(capacity=1)
+        consumers = [
+            asyncio.create_task(take(broker.subscribe(CELLPHONE.topic), messages))
+            for _ in range(subscribers)
+        ]
+        for price in range(messages):
+            await broker.publish(CELLPHONE.topic, CELLPHONE._replace(price=price))
+        results = await asyncio.gather(*consumers)
+        return sum(len(received) for received in results)
+
+    assert asyncio.run(scenario()) == subscribers * messages
@@ -0,0 +1,45 @@
+from ..solution_01.broker import Broker
+from ..solution_01.producer import Producer
+from ..solution_01.product import Product
+from ..solution_01.store import Store
+
+cellphone = Product("MobileX", "TechS", 300)
+
+
+def test_releases_and_withdrawals_update_the_index():
+    broker = Broker()
+    techs = Producer(name="TechS", broker=broker)
+    store = Store(name="AllYouNeed", producers=[techs])
+
+    assert not store.is_available(cellphone)
+
+    techs.release_products([("MobileX", 300), ("BookPro", 1500)])
+    assert store.is_available(cellphone)
+    assert store.is_available(Product("BookPro", "TechS", 999))
+    assert store.carriers(cellphone) == [techs]
+
+    techs.withdraw_product("MobileX")
+    assert not store.is_available(cellphone)
+    assert store.is_available(Product("BookPro", "TechS", 1500))
+
+
+def test_producers_added_later_are_indexed():
+    broker = Broker()
+    techs = Producer(name="TechS", broker=broker)
+    techs.release_product("MobileX", 300)
+    store = Store(name="AllYouNeed")
+
+    store.add_producer(techs)
+
+    assert store.is_available(cellphone)
+    assert techs.stores == [store]
+
+
+def test_availability_checks_do_not_query_producers():
+    broker = Broker()
+    techs = Producer(name="TechS", broker=broker)
+    store = Store(name="AllYouNeed", producers=[techs])
+    techs.release_product("MobileX", 300)
+    techs.products.clear()
+
+    assert store.is_available(cellphone)
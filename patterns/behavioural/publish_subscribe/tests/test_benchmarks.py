@@ -0,0 +1,56 @@
+import json
+
+from ..benchmarks import codec, delivery, ring_buffer
+
+
+def test_ring_buffer_benchmark(capsys):
+    ring_buffer.main(
+        ["--messages", "4096", "--batches", "1", "64", "--capacity", "256"]
+    )
+
+    results = json.loads(capsys.readouterr().out)["results"]
+    assert [(result["mode"], result["batch"]) for result in results] == [
+        ("single_thread", 1),
+        ("multi_producer", 1),
+        ("single_thread", 64),
+        ("multi_producer", 64),
+    ]
+    assert all(result["messages"] == 4096 for result in results)
+
+
+def test_codec_benchmark(capsys):
+    codec.main(["--products", "512", "--batches", "1", "64", "--repeat", "1"])
+
+    results = json.loads(capsys.readouterr().out)["results"]
+    assert [(result["format"], result["batch"]) for result in results] == [
+        (name, batch) for batch in (1, 64) for name in ("binary", "pickle", "json")
+    ]
+
+
+def test_delivery_benchmark_is_deterministic_with_a_simulated_clock(capsys):
+    arguments = ["--customers", "20", "--products", "200", "--poll-interval", "0.5"]
+    delivery.main(arguments)
+    first = json.loads(capsys.readouterr().out)["results"]
+    delivery.main(arguments)
+    second = json.loads(capsys.readouterr().out)["results"]
+
+    polling, push = first
+    assert polling["deliveries"] == push["deliveries"] == polling["expected"] == 100
+    assert 0 < polling["p50_ms"] <= polling["p999_ms"] <= 500
+    assert push["max_ms"] == 0
+    latencies = ["p50_ms", "p99_ms", "p999_ms", "max_ms"]
+    assert [[result[key] for key in latencies] for result in second] == [
+        [result[key] for key in latencies] for result in first
+    ]
+
+
+def test_delivery_benchmark_runs_on_a_real_clock(tmp_path):
+    output = tmp_path / "delivery.json"
+    delivery.main(
+        ["--products", "50", "--rate", "1000", "--poll-interval", "0.01"]
+        + ["--real-clock", "--modes", "push", "--output", str(output)]
+    )
+
+    (result,) = json.loads(output.read_text())["results"]
+    assert result["clock"] == "real"
+    assert result["deliveries"] == result["expected"]
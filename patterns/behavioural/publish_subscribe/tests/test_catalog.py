@@ -0,0 +1,43 @@
+from ..solution_01.broker import Broker
+from ..solution_01.producer import Producer
+from ..solution_01.product import Product, ProductCatalog
+from ..solution_01.store import Store
+
+
+def test_products_with_different_prices_share_a_key_but_are_not_equal():
+    cheap = Product("MobileX", "TechS", 280)
+    expensive = Product("MobileX", "TechS", 300)
+
+    assert cheap != expensive
+    assert cheap < expensive
+    assert cheap.key == expensive.key
+    assert expensive not in {cheap}
+
+
+def test_catalog_keeps_one_listing_with_the_latest_price():
+    catalog = ProductCatalog()
+    first = catalog.update(Product("MobileX", "TechS", 300))
+    second = catalog.update(Product("Mobile" + "X", "TechS", 280))
+
+    assert first is second
+    assert len(catalog) == 1
+    assert catalog.price_of("MobileX", "TechS") == 280
+    assert list(catalog) == [Product("MobileX", "TechS", 280)]
+    assert catalog.get("MobileX", "AllComfort") is None
+
+
+def test_rereleases_update_prices_across_carriers():
+    broker = Broker()
+    techs = Producer(name="TechS", broker=broker)
+    store = Store(name="AllYouNeed", producers=[techs])
+    cellphone = Product("MobileX", "TechS", 0)
+
+    techs.release_product("MobileX", 300)
+    techs.release_product("MobileX", 280)
+
+    assert len(techs.products) == 1
+    assert store.price_of(cellphone) == 280
+
+    techs.withdraw_products(["MobileX", "Unknown"])
+    assert cellphone not in techs.products
+    assert store.price_of(cellphone) is None
@@ -0,0 +1,116 @@
+import asyncio
+import threading
+from queue import Full
+from typing import List, Tuple
+
+import pytest
+
+from ..solution_01.channel import AsyncRingBuffer, RingBuffer
+
+
+def test_capacity_is_rounded_to_a_power_of_two():
+    assert RingBuffer(capacity=1000).capacity == 1024
+
+
+def test_messages_wrap_around_in_order():
+    ring = RingBuffer(capacity=8)
+    received: List[int] = []
+
+    for start in range(0, 100, 5):
+        ring.put_many(range(start, start + 5))
+        received.extend(ring.drain(max_items=3))
+        received.extend(ring.drain())
+
+    assert received == list(range(100))
+    assert len(ring) == 0
+
+
+def test_full_buffer_times_out():
+    ring = RingBuffer(capacity=4)
+    ring.put_many([1, 2, 3, 4])
+
+    with pytest.raises(Full):
+        ring.put(5, timeout=0.01)
+    assert ring.drain() == [1, 2, 3, 4]
+
+
+def test_multiple_producers_keep_their_own_order():
+    ring = RingBuffer(capacity=256)
+    producers, messages = 4, 5_000
+
+    def produce(producer: int) -> None:
+        for message in range(messages):
+            if message % 2:
+                ring.put((producer, message))
+            else:
+                ring.put_many([(producer, message)])
+
+    threads = [threading.Thread(target=produce, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+
+    received: List[Tuple[int, int]] = []
+    while len(received) < producers * messages:
+        batch = ring.drain()
+        if not batch:
+            ring.wait(0.1)
+        received.extend(batch)
+
+    for thread in threads:
+        thread.join()
+    for producer in range(producers):
+        own = [message for source, message in received if source == producer]
+        assert own == list(range(messages))
+
+
+def test_batched_producers_are_drained_while_they_write():
+    ring = RingBuffer(capacity=1024)
+    producers, batches, batch = 8, 200, 64
+
+    def produce(producer: int) -> None:
+        for start in range(0, batches * batch, batch):
+            ring.put_many(
+                [(producer, message) for message in range(start, start + batch)]
+            )
+
+    threads = [
+        threading.Thread(target=produce, args=(index,), daemon=True)
+        for index in range(producers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    received: List[Tuple[int, int]] = []
+    while len(received) < producers * batches * batch:
+        batch_received = ring.drain(max_items=100)
+        if not batch_received:
+            assert ring.wait(5)
+        received.extend(batch_received)
+
+    for thread in threads:
+        thread.join(5)
+    assert len(ring) == 0
+    for producer in range(producers):
+        own = [message for source, message in received if source == producer]
+        assert own == list(range(batches * batch))
+
+
+def test_async_consumer_is_woken_by_thread_producers():
+    async def consume() -> List[int]:
+        channel = AsyncRingBuffer(RingBuffer(capacity=16))
+
+        def produce() -> None:
+            for message in range(100):
+                channel.ring.put(message)
+
+        producer = threading.Thread(target=produce)
+        received: List[int] = []
+        producer.start()
+        while len(received) < 100:
+            received.extend(await asyncio.wait_for(channel.get_batch(), 5))
+        producer.join()
+        await channel.put(100)
+        received.extend(await channel.get_batch())
+        return received
+
+    assert asyncio.run(consume()) == list(range(101))
@@ -0,0 +1,66 @@
+import threading
+from typing import List
+
+import pytest
+
+from ..solution_01.network import BrokerClient, BrokerServer
+from ..solution_01.product import Product, ProductCodec
+
+PRODUCTS = [
+    Product("MobileX", "TechS", 300.5),
+    Product("GiantSofa", "AllComfort", 800),
+    Product("MobileX", "TechS", 280.25),
+    Product("Café", "Crème", 2.5),
+]
+
+
+def test_batches_round_trip_with_repeated_and_unicode_names():
+    codec = ProductCodec()
+    decoded = codec.decode(codec.encode(PRODUCTS))
+
+    assert decoded == PRODUCTS
+    assert all(type(product) is Product for product in decoded)
+
+
+def test_batches_are_written_back_to_back_into_a_reused_buffer():
+    codec = ProductCodec()
+    buffer = bytearray()
+    middle = codec.encode_into(PRODUCTS[:2], buffer)
+    end = codec.encode_into(PRODUCTS[2:], buffer, offset=middle)
+    capacity = len(buffer)
+
+    first, position = codec.decode_from(memoryview(buffer))
+    second, position = codec.decode_from(memoryview(buffer), position)
+
+    assert first + second == PRODUCTS
+    assert position == end
+    codec.encode_into(PRODUCTS[:1], buffer)
+    assert len(buffer) == capacity
+
+
+def test_single_products_round_trip():
+    codec = ProductCodec()
+    data = codec.dumps(PRODUCTS[3])
+
+    assert codec.loads(data) == Product("Café", "Crème", 2.5)
+    assert len(data) < 32
+    with pytest.raises(ValueError):
+        codec.loads(b"\x09" + data[1:])
+
+
+def test_codec_serializes_broker_messages(tmp_path):
+    received: List[Product] = []
+    done = threading.Event()
+
+    def collect(product: Product) -> None:
+        received.append(product)
+        done.set()
+
+    with BrokerServer(str(tmp_path / "broker.sock")) as server:
+        with BrokerClient(server.address, ProductCodec()) as consumer:
+            consumer.subscribe(PRODUCTS[0].topic, collect)
+            with BrokerClient(server.address, ProductCodec()) as publisher:
+                publisher.publish(PRODUCTS[0].topic, PRODUCTS[0])
+            assert done.wait(5)
+
+    assert received == PRODUCTS[:1]
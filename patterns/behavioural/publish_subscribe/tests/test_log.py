@@ -0,0 +1,157 @@
+import zlib
+from typing import List
+
+from ..solution_01.broker import Broker
+from ..solution_01.log import ConsumerGroup, OffsetStore, TopicLog
+from ..solution_01.producer import Producer
+from ..solution_01.product import Product
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_reads_start_at_any_offset_across_segments():
+    log = TopicLog("numbers", segment_bytes=10, sizeof=lambda _: 4)
+    for number in range(10):
+        log.append(number)
+
+    assert log.segments(0) == 5
+    assert [record.message for record in log.read(0, 3, max_messages=4)] == [3, 4, 5, 6]
+    assert [record.offset for record in log.read(0, 8)] == [8, 9]
+    assert log.read(0, 10) == []
+
+
+def test_retention_drops_whole_segments_by_size_and_age():
+    clock = FakeClock()
+    log = TopicLog(
+        "numbers",
+        segment_bytes=8,
+        retention_bytes=16,
+        retention_seconds=60,
+        sizeof=lambda _: 4,
+        clock=clock,
+    )
+    for number in range(10):
+        log.append(number)
+
+    assert log.start_offset(0) == 6
+    assert [record.offset for record in log.read(0, 0)] == [6, 7, 8, 9]
+
+    clock.now = 61
+    log.append(10)
+    assert (log.start_offset(0), log.end_offset(0)) == (10, 11)
+
+
+def test_group_members_split_the_partitions():
+    log = TopicLog("numbers", partitions=4)
+    for number in range(100):
+        log.append(number)
+
+    group = ConsumerGroup("billing", log)
+    first, second = group.join("first"), group.join("second")
+    first_batch, second_batch = first.poll(), second.poll()
+
+    assert {record.partition for record in first_batch} == {0, 2}
+    assert {record.partition for record in second_batch} == {1, 3}
+    received = [record.message for record in first_batch + second_batch]
+    assert sorted(received) == list(range(100))
+
+    # Another group reads the same log independently
+    other = ConsumerGroup("audit", log).join("only")
+    assert len(other.poll()) == 100
+
+
+def test_keyed_messages_land_on_a_stable_partition():
+    log = TopicLog("products", partitions=4, partition_key=lambda product: product[0])
+    records = [log.append((name, 300)) for name in ["MobileX", "Tablet", "MobileX"]]
+
+    # The same partitions in every process, whatever PYTHONHASHSEED is
+    assert [record.partition for record in records] == [
+        zlib.crc32(name.encode()) % 4 for name in ["MobileX", "Tablet", "MobileX"]
+    ]
+
+
+def test_polls_rotate_over_the_partitions():
+    log = TopicLog("numbers", partitions=2)
+    for number in range(20):
+        log.append(number)
+
+    consumer = ConsumerGroup("billing", log).join("only")
+    partitions = [consumer.poll(max_messages=2)[0].partition for _ in range(4)]
+
+    assert partitions == [0, 1, 0, 1]
+
+
+def test_committed_offsets_survive_a_restart(tmp_path):
+    path = str(tmp_path / "offsets.json")
+    log = TopicLog("numbers", partitions=2)
+    for number in range(10):
+        log.append(number)
+
+    consumer = ConsumerGroup("billing", log, OffsetStore(path)).join("only")
+    assert len(consumer.poll(max_messages=6)) == 6
+    consumer.close()
+
+    for number in range(10, 14):
+        log.append(number)
+    restarted = ConsumerGroup("billing", log, OffsetStore(path)).join("only")
+    received = [record.message for record in restarted.poll()]
+
+    assert sorted(received) == [3, 5, 7, 9, 10, 11, 12, 13]
+
+
+def test_leaving_members_hand_over_their_partitions():
+    log = TopicLog("numbers", partitions=2)
+    group = ConsumerGroup("billing", log)
+    first, second = group.join("first"), group.join("second")
+    for number in range(4):
+        log.append(number)
+
+    assert len(first.poll()) == 2
+    first.close()
+    log.append(4)
+
+    received = [record.message for record in second.poll()]
+    assert sorted(received) == [1, 3, 4]
+
+
+def test_members_only_commit_the_partitions_they_still_own():
+    log = TopicLog("numbers", partitions=2)
+    for number in range(100):
+        log.append(number)
+
+    group = ConsumerGroup("billing", log)
+    first = group.join("first")
+    assert first.poll(max_messages=0) == []
+    second = group.join("second")
+    assert len(second.poll()) == 50
+    second.commit()
+
+    # The first member still remembers partition 1 at offset 0
+    first.close()
+
+    assert group.committed() == {0: 0, 1: 50}
+
+
+def test_customers_can_replay_releases_they_missed():
+    broker = Broker()
+    log = broker.log("TechS.MobileX")
+    producer = Producer(name="TechS", broker=broker)
+    producer.release_product("MobileX", 300)
+    producer.release_product("MobileX", 280)
+
+    consumer = ConsumerGroup("John", log).join("phone")
+    prices: List[float] = [record.message.price for record in consumer.poll()]
+
+    assert prices == [300, 280]
+    assert consumer.poll() == []
+    consumer.seek(0, 0)
+    assert [record.message for record in consumer.poll()] == [
+        Product("MobileX", "TechS", 300),
+        Product("MobileX", "TechS", 280),
+    ]
@@ -0,0 +1,118 @@
+import threading
+from queue import Full
+from typing import List
+
+import pytest
+
+from ..solution_01.broker import Broker
+from ..solution_01.channel import Mailbox
+from ..solution_01.customer import Customer
+from ..solution_01.producer import Producer
+from ..solution_01.product import Product
+
+
+def test_drop_policies_keep_the_mailbox_bounded():
+    newest = Mailbox(print, capacity=2, overflow="drop_newest")
+    oldest = Mailbox(print, capacity=2, overflow="drop_oldest")
+    for message in range(5):
+        newest.put(message)
+        oldest.put(message)
+
+    assert newest.get_batch() == [0, 1]
+    assert oldest.get_batch() == [3, 4]
+    assert (
+        newest.counters()
+        == oldest.counters()
+        == {
+            "lag": 0,
+            "delivered": 2,
+            "dropped": 3,
+            "conflated": 0,
+            "failed": 0,
+        }
+    )
+
+
+def test_conflation_keeps_the_latest_price_per_product():
+    mailbox = Mailbox(print, capacity=2, overflow="conflate")
+    for price in (300, 290, 280):
+        mailbox.put(Product("MobileX", "TechS", price))
+    mailbox.put(Product("GiantSofa", "AllComfort", 800))
+    mailbox.put(Product("MobileX", "TechS", 270))
+
+    assert mailbox.lag == 2
+    assert [product.price for product in mailbox.get_batch()] == [270, 800]
+    assert mailbox.conflated == 3
+
+
+def test_blocking_mailbox_times_out_when_full():
+    mailbox = Mailbox(print, capacity=1, timeout=0.01)
+    mailbox.put(1)
+
+    with pytest.raises(Full):
+        mailbox.put(2)
+    assert mailbox.get_batch(max_items=1) == [1]
+
+
+def test_slow_subscribers_do_not_hold_up_the_producer():
+    broker = Broker()
+    gate = threading.Event()
+    received: List[Product] = []
+
+    def slow(product: Product) -> None:
+        gate.wait(5)
+        received.append(product)
+
+    mailbox = Mailbox(slow, capacity=4, overflow="drop_oldest").start()
+    broker.subscribe("TechS.MobileX", mailbox)
+    producer = Producer(name="TechS", broker=broker)
+    for price in range(100):
+        producer.release_product("MobileX", price)
+
+    assert mailbox.lag <= 4
+    gate.set()
+    mailbox.close()
+
+    assert received[-1].price == 99
+    assert mailbox.dropped == 100 - len(received)
+
+
+def test_failing_messages_do_not_stop_the_worker():
+    received: List[int] = []
+
+    def picky(message: int) -> None:
+        if message % 2:
+            raise ValueError(f"Odd message {message}")
+        received.append(message)
+
+    mailbox = Mailbox(picky, capacity=1, timeout=5).start()
+    for message in range(10):
+        mailbox.put(message)
+    mailbox.close()
+
+    assert received == [0, 2, 4, 6, 8]
+    assert mailbox.failed == 5
+    assert str(mailbox.last_error) == "Odd message 9"
+
+
+def test_closed_mailboxes_drop_new_messages():
+    mailbox = Mailbox(print, capacity=1).start()
+    assert mailbox.put(1)
+    mailbox.close()
+
+    assert not mailbox.put(2)
+    assert mailbox.lag == 0
+    assert mailbox.counters()["dropped"] == 1
+
+
+def test_customers_behind_a_mailbox_are_notified():
+    broker = Broker()
+    cellphone = Product("MobileX", "TechS", 300)
+    customer = Customer(name="John", interests=[cellphone])
+    mailbox = Mailbox(customer.notify, overflow="conflate").start()
+    broker.subscribe(cellphone.topic, mailbox)
+
+    Producer(name="TechS", broker=broker).release_product("MobileX", 300)
+    mailbox.close()
+
+    assert customer.satisfied
@@ -0,0 +1,153 @@
+import multiprocessing
+import threading
+from typing import Any, List
+
+import pytest
+
+from ..solution_01.customer import Customer
+from ..solution_01.network import Address, BrokerClient, BrokerServer, ClientPool
+from ..solution_01.network.framing import HEADER, PUBLISH, TOPIC, encode, parse
+from ..solution_01.producer import Producer
+from ..solution_01.product import Product, ProductCodec
+
+
+def release(address: Address) -> None:
+    with BrokerClient(address, ProductCodec()) as broker:
+        producer = Producer(name="TechS", broker=broker)
+        producer.release_products([("MobileX", 300), ("Tablet", 500)])
+
+
+def test_pipelined_publishes_arrive_in_order(tmp_path):
+    with BrokerServer(str(tmp_path / "broker.sock")) as server:
+        with BrokerClient(server.address) as consumer:
+            received: List[int] = []
+            done = threading.Event()
+
+            def collect(message: int) -> None:
+                received.append(message)
+                if len(received) == 5_000:
+                    done.set()
+
+            consumer.subscribe("numbers", collect)
+
+            with BrokerClient(server.address, send_buffer_size=1024) as publisher:
+                sequences = [publisher.publish("numbers", n) for n in range(5_000)]
+                publisher.flush(timeout=5)
+
+            assert done.wait(5)
+
+    assert sequences == list(range(1, 5_001))
+    assert received == list(range(5_000))
+
+
+def test_late_subscribers_get_retained_messages_over_tcp():
+    with BrokerServer(("127.0.0.1", 0)) as server:
+        with BrokerClient(server.address) as publisher:
+            publisher.publish("TechS.MobileX", {"price": 300}, retain=True)
+            publisher.publish("TechS.Tablet", {"price": 500})
+            publisher.flush(timeout=5)
+
+        received: List[Any] = []
+        with BrokerClient(server.address) as consumer:
+            consumer.subscribe("TechS.MobileX", received.append)
+            consumer.subscribe("TechS.Tablet", received.append)
+
+    assert received == [{"price": 300}]
+
+
+def test_pool_shares_a_bounded_number_of_connections(tmp_path):
+    with BrokerServer(str(tmp_path / "broker.sock")) as server:
+        received: List[int] = []
+        done = threading.Event()
+
+        def collect(message: int) -> None:
+            received.append(message)
+            if len(received) == 800:
+                done.set()
+
+        with BrokerClient(server.address) as consumer:
+            consumer.subscribe("numbers", collect)
+
+            with ClientPool(server.address, size=2) as pool:
+
+                def publish(start: int) -> None:
+                    for number in range(start, start + 100):
+                        pool.publish("numbers", number)
+
+                threads = [
+                    threading.Thread(target=publish, args=(start,))
+                    for start in range(0, 800, 100)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                pool.flush(timeout=5)
+
+                assert 1 <= len(pool.clients) <= 2
+
+            assert done.wait(5)
+
+    assert sorted(received) == list(range(800))
+
+
+def test_producer_in_another_process_reaches_customers(tmp_path):
+    with BrokerServer(str(tmp_path / "broker.sock")) as server:
+        cellphone = Product("MobileX", "TechS", 300)
+        tablet = Product("Tablet", "TechS", 500)
+        customer = Customer(name="John", interests=[cellphone, tablet])
+        done = threading.Event()
+
+        with BrokerClient(server.address, ProductCodec()) as broker:
+            customer.subscribe(broker)
+            broker.subscribe(tablet.topic, lambda _: done.set())
+
+            process = multiprocessing.Process(target=release, args=(server.address,))
+            process.start()
+            process.join(10)
+
+            assert done.wait(5)
+
+    assert process.exitcode == 0
+    assert customer.satisfied
+
+
+def test_slow_subscriber_does_not_hold_up_the_others(tmp_path):
+    with BrokerServer(str(tmp_path / "broker.sock"), outbound_size=8) as server:
+        stalled = threading.Event()
+        release_slow = threading.Event()
+        received: List[int] = []
+        done = threading.Event()
+
+        def block(_: Any) -> None:
+            stalled.set()
+            release_slow.wait(10)
+
+        def collect(message: List[int]) -> None:
+            received.append(len(message))
+            if len(received) == 200:
+                done.set()
+
+        with BrokerClient(server.address) as slow, BrokerClient(server.address) as fast:
+            slow.subscribe("numbers", block)
+            fast.subscribe("numbers", collect)
+
+            # The slow client stops reading, so its socket buffers fill up
+            with BrokerClient(server.address) as publisher:
+                for _ in range(200):
+                    publisher.publish("numbers", [0] * 10_000)
+                publisher.flush(timeout=5)
+
+            assert done.wait(5)
+            assert stalled.is_set()
+            release_slow.set()
+
+    assert received == [10_000] * 200
+
+
+def test_frames_with_an_oversized_topic_length_are_rejected():
+    frame = bytearray(encode(PUBLISH, 1, "topic", b"payload"))
+    TOPIC.pack_into(frame, HEADER.size, 1_000)
+
+    with pytest.raises(ValueError):
+        parse(frame)
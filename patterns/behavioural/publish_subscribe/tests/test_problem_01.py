@@ -0,0 +1,5 @@
+from ..problem_01.main import main
+
+
+def test_problem_01():
+    main(time_scale=0.01)
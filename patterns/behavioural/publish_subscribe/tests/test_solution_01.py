@@ -0,0 +1,39 @@
+from typing import List
+
+from ..solution_01.broker import Broker
+from ..solution_01.customer import Customer
+from ..solution_01.main import main
+from ..solution_01.producer import Producer
+from ..solution_01.product import Product
+
+
+def test_solution_01():
+    main(time_scale=0.01)
+
+
+def test_release_is_pushed_to_subscribers_immediately():
+    broker = Broker()
+    producer = Producer(name="TechS", broker=broker)
+    cellphone = Product("MobileX", "TechS", 300)
+    customer = Customer(name="John", interests=[cellphone])
+    customer.subscribe(broker)
+    received: List[Product] = []
+    broker.subscribe(cellphone.topic, received.append)
+
+    # Delivery happens inside the release call, with nothing polling for it
+    producer.release_product("MobileX", 300)
+
+    assert customer.satisfied
+    assert received == [cellphone]
+
+
+def test_late_subscribers_get_the_retained_release():
+    broker = Broker()
+    producer = Producer(name="TechS", broker=broker)
+    cellphone = producer.release_product("MobileX", 300)
+    received: List[Product] = []
+
+    broker.subscribe(cellphone.topic, received.append)
+    broker.subscribe("TechS.Other", received.append)
+
+    assert received == [cellphone]
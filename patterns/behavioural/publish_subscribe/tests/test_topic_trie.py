@@ -0,0 +1,64 @@
+from typing import List
+
+import pytest
+
+from ..solution_01.broker import Broker, TopicTrie, topic_matches
+from ..solution_01.producer import Producer
+from ..solution_01.product import Product
+
+
+def test_wildcards_match_one_or_many_levels():
+    trie = TopicTrie()
+    brand, name, everything = [], [], []
+    trie.add("TechS.*", brand.append)
+    trie.add("*.MobileX", name.append)
+    trie.add("#", everything.append)
+
+    assert set(trie.match("TechS.MobileX")) == {
+        brand.append,
+        name.append,
+        everything.append,
+    }
+    assert set(trie.match("TechS.Tablet")) == {brand.append, everything.append}
+    assert trie.match("TechS") == (everything.append,)
+    assert topic_matches("TechS.#", "TechS.Phones.MobileX")
+    assert not topic_matches("TechS.*", "TechS.Phones.MobileX")
+
+
+def test_cache_is_invalidated_when_subscriptions_change():
+    trie = TopicTrie()
+    received: List[str] = []
+    trie.add("TechS.*", received.append)
+    assert trie.match("TechS.MobileX") == (received.append,)
+
+    trie.remove("TechS.*", received.append)
+    assert trie.match("TechS.MobileX") == ()
+    assert len(trie) == 0
+
+    trie.add("TechS.MobileX", received.append)
+    trie.add("TechS.#", received.append)
+    # Overlapping patterns still deliver once
+    assert trie.match("TechS.MobileX") == (received.append,)
+
+
+def test_any_levels_must_come_last():
+    with pytest.raises(ValueError):
+        TopicTrie().add("#.MobileX", print)
+
+
+def test_broker_routes_releases_to_pattern_subscribers():
+    broker = Broker()
+    producer = Producer(name="TechS", broker=broker)
+    cellphone = producer.release_product("MobileX", 300)
+    received: List[Product] = []
+
+    # Retained releases that match the pattern are delivered on subscription
+    broker.subscribe("TechS.*", received.append)
+    tablet = producer.release_product("Tablet", 500)
+    Producer(name="AllComfort", broker=broker).release_product("GiantSofa", 800)
+
+    assert received == [cellphone, tablet]
+    assert broker.publish("TechS.MobileX", cellphone) == 1
+
+    broker.unsubscribe("TechS.*", received.append)
+    assert broker.publish("TechS.MobileX", cellphone) == 0
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import time
+from typing import List
+
+from ..solution_01.broker import Broker
+from ..solution_01.customer import Customer
+from ..solution_01.producer import Producer
+from ..solution_01.product import Product
+from ..solution_01.store import Store
+
+CELLPHONE = Product("MobileX", "TechS", 300)
+LAPTOP = Product("BookPro", "TechS", 1500)
+
+
+def release_later(producer: Producer, *items: tuple) -> threading.Timer:
+    timer = threading.Timer(0.05, producer.release_products, [list(items)])
+    timer.start()
+    return timer
+
+
+def test_wait_for_returns_once_every_product_is_released():
+    techs = Producer(name="TechS", broker=Broker())
+    store = Store(name="AllYouNeed", producers=[techs])
+    techs.release_product("MobileX", 300)
+
+    timer = release_later(techs, ("BookPro", 1500))
+    assert store.wait_for([CELLPHONE, LAPTOP], timeout=5)
+    timer.join()
+
+
+def test_wait_for_times_out():
+    techs = Producer(name="TechS", broker=Broker())
+    store = Store(name="AllYouNeed", producers=[techs])
+    techs.release_product("MobileX", 300)
+
+    start = time.monotonic()
+    assert not store.wait_for([CELLPHONE, LAPTOP], timeout=0.05)
+    assert time.monotonic() - start >= 0.04
+    # A waiter that timed out leaves nothing behind to wake later
+    timer = release_later(techs, ("BookPro", 1500))
+    assert store.wait_for([CELLPHONE, LAPTOP], timeout=5)
+    timer.join()
+
+
+def test_available_products_do_not_block():
+    techs = Producer(name="TechS", broker=Broker())
+    techs.release_products([("MobileX", 300), ("BookPro", 1500)])
+    store = Store(name="AllYouNeed", producers=[techs])
+
+    assert store.wait_for([CELLPHONE, LAPTOP], timeout=0)
+
+
+def test_withdrawn_products_are_waited_for_again():
+    techs = Producer(name="TechS", broker=Broker())
+    store = Store(name="AllYouNeed", producers=[techs])
+    techs.release_product("MobileX", 300)
+
+    results: List[bool] = []
+    waiting = threading.Thread(
+        target=lambda: results.append(store.wait_for([CELLPHONE, LAPTOP], 0.2))
+    )
+    waiting.start()
+    techs.withdraw_product("MobileX")
+    techs.release_product("BookPro", 1500)
+    waiting.join()
+
+    assert results == [False]
+    timer = release_later(techs, ("MobileX", 300))
+    assert store.wait_for([CELLPHONE, LAPTOP], timeout=5)
+    timer.join()
+
+
+def test_customers_wait_for_their_interests():
+    techs = Producer(name="TechS", broker=Broker())
+    store = Store(name="AllYouNeed", producers=[techs])
+    customer = Customer(name="Ana", interests=[CELLPHONE, LAPTOP])
+
+    timer = release_later(techs, ("MobileX", 300), ("BookPro", 1500))
+    assert customer.wait_for_interests(store, timeout=5)
+    assert customer.satisfied
+    timer.join()
+
+
+def test_wait_for_async_is_woken_from_other_threads():
+    techs = Producer(name="TechS", broker=Broker())
+    store = Store(name="AllYouNeed", producers=[techs])
+
+    async def scenario() -> bool:
+        timer = release_later(techs, ("MobileX", 300), ("BookPro", 1500))
+        ready = await store.wait_for_async([CELLPHONE, LAPTOP], timeout=5)
+        timer.join()
+        return ready
+
+    assert asyncio.run(scenario())
+
+
+def test_wait_for_async_times_out():
+    store = Store(name="AllYouNeed")
+
+    assert not asyncio.run(store.wait_for_async([CELLPHONE], timeout=0.05))
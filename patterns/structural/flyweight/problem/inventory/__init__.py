@@ -0,0 +1,4 @@
+from .item import StockItem
+from .warehouse import Warehouse
+
+__all__ = ["StockItem", "Warehouse"]
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class StockItem:
+    name: str
+    brand: str
+    price: float
+    description: str
+    serial: int
+    shelf: str
+
+    def label(self) -> str:
+        return f"#{self.serial} {self.brand} {self.name} (${self.price}) @ {self.shelf}"
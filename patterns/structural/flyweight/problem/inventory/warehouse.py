@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from .item import StockItem
+
+
+@dataclass
+class Warehouse:
+    items: List[StockItem] = field(default_factory=list)
+
+    def receive(
+        self,
+        name: str,
+        brand: str,
+        price: float,
+        description: str,
+        serial: int,
+        shelf: str,
+    ) -> StockItem:
+        item = StockItem(name, brand, price, description, serial, shelf)
+        self.items.append(item)
+        return item
+
+    def value(self) -> float:
+        return sum(item.price for item in self.items)
@@ -0,0 +1,5 @@
+from .catalog import ProductCatalog, ProductType
+from .item import StockItem
+from .warehouse import Warehouse
+
+__all__ = ["ProductCatalog", "ProductType", "StockItem", "Warehouse"]
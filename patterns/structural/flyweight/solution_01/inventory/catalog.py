@@ -0,0 +1,24 @@
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, NamedTuple
+
+
+class ProductType(NamedTuple):
+    name: str
+    brand: str
+    price: float
+    description: str
+
+
+@dataclass
+class ProductCatalog:
+    _types: Dict[ProductType, ProductType] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def get(self, name: str, brand: str, price: float, description: str) -> ProductType:
+        product_type = ProductType(
+            sys.intern(name), sys.intern(brand), price, description
+        )
+        return self._types.setdefault(product_type, product_type)
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+from .catalog import ProductType
+
+
+@dataclass(slots=True)
+class StockItem:
+    product: ProductType
+    serial: int
+    shelf: str
+
+    def label(self) -> str:
+        product = self.product
+        return (
+            f"#{self.serial} {product.brand} {product.name} "
+            f"(${product.price}) @ {self.shelf}"
+        )
@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from .catalog import ProductCatalog
+from .item import StockItem
+
+
+@dataclass
+class Warehouse:
+    catalog: ProductCatalog = field(default_factory=ProductCatalog)
+    items: List[StockItem] = field(default_factory=list)
+
+    def receive(
+        self,
+        name: str,
+        brand: str,
+        price: float,
+        description: str,
+        serial: int,
+        shelf: str,
+    ) -> StockItem:
+        product = self.catalog.get(name, brand, price, description)
+        item = StockItem(product, serial, shelf)
+        self.items.append(item)
+        return item
+
+    def value(self) -> float:
+        return sum(item.product.price for item in self.items)
@@ -0,0 +1,26 @@
+from .inventory import Warehouse
+
+PHONE_DESCRIPTION = "6.1 inch screen, 128 GB storage, dual camera. " * 10
+MUG_DESCRIPTION = "Ceramic mug, 350 ml, dishwasher safe. " * 10
+
+
+def main() -> None:
+    warehouse = Warehouse()
+
+    for serial in range(10_000):
+        warehouse.receive(
+            "MobileX", "TechS", 300, PHONE_DESCRIPTION, serial, f"A{serial % 20}"
+        )
+
+    for serial in range(10_000, 15_000):
+        warehouse.receive(
+            "CoffeeM", "IndustrialTea", 20, MUG_DESCRIPTION, serial, f"B{serial % 5}"
+        )
+
+    print(warehouse.items[0].label())
+    print(f"{len(warehouse.items)} items worth ${warehouse.value()}")
+    print(f"{len(warehouse.catalog)} product types shared between them")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+from ..problem.main import main
+
+
+def test_problem():
+    main()
@@ -0,0 +1,19 @@
+from ..solution_01.inventory import Warehouse
+from ..solution_01.main import main
+
+
+def test_solution_01():
+    main()
+
+
+def test_equal_products_share_one_flyweight():
+    warehouse = Warehouse()
+
+    first = warehouse.receive("MobileX", "TechS", 300, "Phone", 1, "A1")
+    second = warehouse.receive("MobileX", "TechS", 300, "Phone", 2, "A2")
+    mug = warehouse.receive("CoffeeM", "IndustrialTea", 20, "Mug", 3, "B1")
+
+    assert first.product is second.product
+    assert first.product is not mug.product
+    assert len(warehouse.catalog) == 2
+    assert warehouse.value() == 620